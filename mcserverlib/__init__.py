@@ -1,9 +1,31 @@
-from .catalog import VersionCatalog
-from .manager import ServerManager
-from .models import InstallRequest, InstallResult, ServerManifest, StartCommands
-from .process import ServerProcess
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .catalog import VersionCatalog
+    from .http import HttpClient, default_http_client
+    from .manager import ServerManager
+    from .models import InstallRequest, InstallResult, ServerManifest, StartCommands
+    from .process import ServerProcess
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. for `mcserver --help`, does not pull in every submodule.
+_LAZY_EXPORTS = {
+    "HttpClient": ".http",
+    "InstallRequest": ".models",
+    "InstallResult": ".models",
+    "ServerManager": ".manager",
+    "ServerManifest": ".models",
+    "ServerProcess": ".process",
+    "StartCommands": ".models",
+    "VersionCatalog": ".catalog",
+    "default_http_client": ".http",
+}
 
 __all__ = [
+    "HttpClient",
     "InstallRequest",
     "InstallResult",
     "ServerManager",
@@ -11,4 +33,18 @@ __all__ = [
     "ServerProcess",
     "StartCommands",
     "VersionCatalog",
+    "default_http_client",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
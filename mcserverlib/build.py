@@ -7,18 +7,53 @@ import subprocess
 import sys
 
 
+BUILD_CACHE_DIRNAME = ".build-cache"
+BOOTSTRAP_STAMP_NAME = "bootstrap.stamp"
+
+
 def _run(command: list[str], cwd: Path) -> None:
-    result = subprocess.run(
+    process = subprocess.Popen(
         command,
         cwd=str(cwd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
+        errors="replace",
+        bufsize=1,
     )
-    if result.returncode != 0:
+    if process.stdout is not None:
+        with process.stdout:
+            for line in process.stdout:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+    returncode = process.wait()
+    if returncode != 0:
         raise RuntimeError(
-            f"Command failed with exit code {result.returncode}: {' '.join(command)}"
+            f"Command failed with exit code {returncode}: {' '.join(command)}"
         )
 
 
+def _bootstrap_stamp(project_root: Path) -> Path:
+    return project_root / BUILD_CACHE_DIRNAME / BOOTSTRAP_STAMP_NAME
+
+
+def _pip_bootstrap_needed(project_root: Path) -> bool:
+    stamp = _bootstrap_stamp(project_root)
+    try:
+        stamp_mtime = stamp.stat().st_mtime
+        pyproject_mtime = (project_root / "pyproject.toml").stat().st_mtime
+        stamped_python = stamp.read_text(encoding="utf-8").strip()
+    except OSError:
+        return True
+    return stamped_python != sys.executable or pyproject_mtime > stamp_mtime
+
+
+def _mark_bootstrap_done(project_root: Path) -> None:
+    stamp = _bootstrap_stamp(project_root)
+    stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.write_text(f"{sys.executable}\n", encoding="utf-8")
+
+
 def _pyinstaller_data_arg(source: Path, destination: str) -> str:
     separator = ";" if os.name == "nt" else ":"
     return f"{source}{separator}{destination}"
@@ -27,14 +62,18 @@ def _pyinstaller_data_arg(source: Path, destination: str) -> str:
 def _ensure_windows_icon(project_root: Path) -> Path | None:
     assets_dir = project_root / "assets"
     icon_path = assets_dir / "icon.ico"
+    # icon.ico is committed. Git does not keep mtimes, so a newer-than-logo
+    # check would rewrite the tracked file on fresh clones; only fill a gap.
     if icon_path.exists():
         return icon_path
 
-    logo_candidates = [
-        assets_dir / "logo.png",
-        assets_dir / "kings-logo.png",
-    ]
-    logo_path = next((candidate for candidate in logo_candidates if candidate.exists()), None)
+    # One directory scan instead of a stat per name; the shortest match wins so
+    # a plain logo.png is preferred over variants such as kings-logo.png.
+    logo_path = min(
+        (candidate for candidate in assets_dir.glob("*logo*.png") if candidate.is_file()),
+        key=lambda candidate: (len(candidate.name), candidate.name),
+        default=None,
+    )
     if logo_path is None:
         return None
 
@@ -45,7 +84,9 @@ def _ensure_windows_icon(project_root: Path) -> Path | None:
 
     assets_dir.mkdir(parents=True, exist_ok=True)
     with Image.open(logo_path) as image:
+        # Render one 256px master; ICO encoding downsizes it for the other sizes.
         rgba = image.convert("RGBA")
+        rgba.thumbnail((256, 256), Image.Resampling.LANCZOS)
         rgba.save(
             icon_path,
             format="ICO",
@@ -84,11 +125,10 @@ def build_launcher(
     onefile: bool = True,
     skip_bootstrap: bool = False,
 ) -> Path:
-    if skip_bootstrap:
-        python_cmd = [sys.executable]
-    else:
+    if not skip_bootstrap and _pip_bootstrap_needed(project_root):
         _run([sys.executable, "-m", "pip", "install", "-e", ".[build]"], cwd=project_root)
-        python_cmd = [sys.executable]
+        _mark_bootstrap_done(project_root)
+    python_cmd = [sys.executable]
 
     launcher_script = project_root / "launcher_entry.py"
     command = [
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
+import heapq
+import threading
+import time
+from typing import Any, Callable, Iterable, TypeVar
 import xml.etree.ElementTree as ET
 
-from .http import HttpClient
+from .http import HttpClient, default_http_client
 from .minecraft import MOJANG_MANIFEST_URL
 from .providers.fabric import FABRIC_META
 from .providers.forge import FORGE_METADATA_URL
@@ -12,88 +18,197 @@ from .providers.purpur import PURPUR_API
 from .providers.quilt import QUILT_META
 from .utils import is_stable_version, normalize_loader, version_key
 
+try:
+    import ijson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+
+DEFAULT_CACHE_TTL_SECONDS = 900.0
+
+_T = TypeVar("_T")
+
+
+def _id_type_pairs(entries: Iterable[dict[str, Any]]) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    for entry in entries:
+        version_id = str(entry.get("id", ""))
+        if version_id:
+            pairs.append((version_id, str(entry.get("type", ""))))
+    return pairs
+
 
 class VersionCatalog:
     """Read-only metadata helper used by the launcher UI."""
 
-    def __init__(self, http_client: HttpClient | None = None) -> None:
-        self.http_client = http_client or HttpClient()
+    __slots__ = (
+        "_http_client",
+        "cache_ttl_seconds",
+        "_catalog_cache",
+        "_cache_lock",
+        "_fetch_locks",
+    )
+
+    _MC_HANDLERS: dict[str, Callable[[VersionCatalog, bool], Iterable[str]]] = {
+        "vanilla": lambda s, stable_only: s._vanilla_versions(stable_only),
+        "paper": lambda s, stable_only: s._paper_family_versions("paper"),
+        "folia": lambda s, stable_only: s._paper_family_versions("folia"),
+        "purpur": lambda s, stable_only: s._purpur_versions(),
+        "fabric": lambda s, stable_only: s._fabric_versions(stable_only),
+        "quilt": lambda s, stable_only: s._quilt_versions(stable_only),
+        "forge": lambda s, stable_only: s._forge_mc_versions(stable_only),
+        "neoforge": lambda s, stable_only: s._neoforge_mc_versions(stable_only),
+    }
+    _LOADER_HANDLERS: dict[str, Callable[[VersionCatalog, str, bool], Iterable[str]]] = {
+        "fabric": lambda s, mc, stable_only: s._fabric_loader_versions(mc, stable_only),
+        "quilt": lambda s, mc, stable_only: s._quilt_loader_versions(mc),
+        "forge": lambda s, mc, stable_only: s._forge_versions_for_mc(mc, stable_only),
+        "neoforge": lambda s, mc, stable_only: s._neoforge_versions_for_mc(mc, stable_only),
+    }
+
+    def __init__(
+        self,
+        http_client: HttpClient | None = None,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._http_client = http_client
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._catalog_cache: dict[str, tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        # One lock per cache key so concurrent misses share a single fetch.
+        self._fetch_locks: dict[str, threading.Lock] = {}
+
+    @property
+    def http_client(self) -> HttpClient:
+        if self._http_client is None:
+            self._http_client = default_http_client()
+        return self._http_client
+
+    @http_client.setter
+    def http_client(self, value: HttpClient) -> None:
+        self._http_client = value
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._catalog_cache.clear()
 
     def list_minecraft_versions(
         self, loader: str, stable_only: bool = True, limit: int = 200
     ) -> list[str]:
-        loader_id = normalize_loader(loader)
-        if loader_id == "vanilla":
-            versions = self._vanilla_versions(stable_only=stable_only)
-        elif loader_id in {"paper", "folia"}:
-            versions = self._paper_family_versions(loader_id)
-        elif loader_id == "purpur":
-            versions = self._purpur_versions()
-        elif loader_id == "fabric":
-            versions = self._fabric_versions(stable_only=stable_only)
-        elif loader_id == "quilt":
-            versions = self._quilt_versions(stable_only=stable_only)
-        elif loader_id == "forge":
-            versions = self._forge_mc_versions(stable_only=stable_only)
-        elif loader_id == "neoforge":
-            versions = self._neoforge_mc_versions(stable_only=stable_only)
-        else:
-            versions = []
-        return self._sorted_desc(versions)[:limit]
+        handler = self._MC_HANDLERS.get(normalize_loader(loader))
+        versions = handler(self, stable_only) if handler else []
+        return self._sorted_desc(versions, limit)
 
     def list_loader_versions(
         self, loader: str, minecraft_version: str, stable_only: bool = True, limit: int = 200
     ) -> list[str]:
-        loader_id = normalize_loader(loader)
-        if loader_id == "fabric":
-            versions = self._fabric_loader_versions(
-                minecraft_version=minecraft_version,
-                stable_only=stable_only,
-            )
-        elif loader_id == "quilt":
-            versions = self._quilt_loader_versions(
-                minecraft_version=minecraft_version,
-            )
-        elif loader_id == "forge":
-            versions = self._forge_versions_for_mc(
-                minecraft_version=minecraft_version,
-                stable_only=stable_only,
-            )
-        elif loader_id == "neoforge":
-            versions = self._neoforge_versions_for_mc(
-                minecraft_version=minecraft_version,
-                stable_only=stable_only,
-            )
-        else:
-            versions = []
-        return self._sorted_desc(versions)[:limit]
-
-    def _sorted_desc(self, values: list[str]) -> list[str]:
-        unique = sorted({v for v in values if v}, key=version_key, reverse=True)
-        return unique
+        handler = self._LOADER_HANDLERS.get(normalize_loader(loader))
+        versions = handler(self, minecraft_version, stable_only) if handler else []
+        return self._sorted_desc(versions, limit)
+
+    async def alist_minecraft_versions(
+        self, loader: str, stable_only: bool = True, limit: int = 200
+    ) -> list[str]:
+        return await asyncio.to_thread(
+            self.list_minecraft_versions, loader, stable_only, limit
+        )
+
+    async def alist_loader_versions(
+        self, loader: str, minecraft_version: str, stable_only: bool = True, limit: int = 200
+    ) -> list[str]:
+        return await asyncio.to_thread(
+            self.list_loader_versions, loader, minecraft_version, stable_only, limit
+        )
+
+    async def refresh_all(
+        self, stable_only: bool = True, limit: int = 200
+    ) -> dict[str, list[str]]:
+        """Fetch Minecraft versions for every loader concurrently.
+
+        Loaders whose metadata request fails are left out of the result.
+        """
+        loaders = tuple(self._MC_HANDLERS)
+        results = await asyncio.gather(
+            *(self.alist_minecraft_versions(loader, stable_only, limit) for loader in loaders),
+            return_exceptions=True,
+        )
+        return {
+            loader: versions
+            for loader, versions in zip(loaders, results)
+            if not isinstance(versions, BaseException)
+        }
+
+    async def prefetch_for(
+        self, loader: str, minecraft_versions: list[str], count: int = 3
+    ) -> None:
+        """Warm the cache with loader versions for the first few MC versions.
+
+        Failures are ignored; a later real query simply fetches again.
+        """
+        if normalize_loader(loader) not in self._LOADER_HANDLERS:
+            return
+        await asyncio.gather(
+            *(
+                self.alist_loader_versions(loader, minecraft_version)
+                for minecraft_version in minecraft_versions[:count]
+            ),
+            return_exceptions=True,
+        )
+
+    def _sorted_desc(self, values: Iterable[str], limit: int) -> list[str]:
+        unique = set(values)
+        if len(unique) <= limit:
+            return sorted(unique, key=version_key, reverse=True)
+        return heapq.nlargest(limit, unique, key=version_key)
+
+    def _cached(self, key: str, fetch: Callable[[], _T]) -> _T:
+        with self._cache_lock:
+            entry = self._catalog_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        with fetch_lock:
+            # Another thread may have filled the entry while we waited.
+            with self._cache_lock:
+                entry = self._catalog_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            value = fetch()
+            with self._cache_lock:
+                self._catalog_cache[key] = (time.monotonic() + self.cache_ttl_seconds, value)
+        return value
+
+    def _get_json(self, url: str) -> Any:
+        return self._cached(url, lambda: self.http_client.get_json(url))
 
     def _vanilla_versions(self, stable_only: bool) -> list[str]:
-        data = self.http_client.get_json(MOJANG_MANIFEST_URL)
-        versions: list[str] = []
-        for entry in data.get("versions", []):
-            version_id = str(entry.get("id", ""))
-            if not version_id:
-                continue
-            if stable_only and entry.get("type") != "release":
-                continue
-            versions.append(version_id)
-        return versions
+        return [
+            version_id
+            for version_id, version_type in self._vanilla_entries()
+            if not stable_only or version_type == "release"
+        ]
+
+    def _vanilla_entries(self) -> list[tuple[str, str]]:
+        # Only (id, type) pairs are kept; with ijson installed the manifest is
+        # streamed so the full document never has to be materialized.
+        def _fetch() -> list[tuple[str, str]]:
+            if ijson is not None:
+                with self.http_client.get_stream(MOJANG_MANIFEST_URL) as stream:
+                    return _id_type_pairs(ijson.items(stream, "versions.item"))
+            data = self.http_client.get_json(MOJANG_MANIFEST_URL)
+            return _id_type_pairs(data.get("versions", []))
+
+        return self._cached(MOJANG_MANIFEST_URL, _fetch)
 
     def _paper_family_versions(self, project: str) -> list[str]:
-        data = self.http_client.get_json(f"{PAPER_API_BASE}/{project}")
-        return [str(v) for v in data.get("versions", [])]
+        data = self._get_json(f"{PAPER_API_BASE}/{project}")
+        return [str(v) for v in data.get("versions", []) if v]
 
     def _purpur_versions(self) -> list[str]:
-        data = self.http_client.get_json(PURPUR_API)
-        return [str(v) for v in data.get("versions", [])]
+        data = self._get_json(PURPUR_API)
+        return [str(v) for v in data.get("versions", []) if v]
 
     def _fabric_versions(self, stable_only: bool) -> list[str]:
-        entries = self.http_client.get_json(f"{FABRIC_META}/game")
+        entries = self._get_json(f"{FABRIC_META}/game")
         versions: list[str] = []
         for entry in entries:
             version = str(entry.get("version", ""))
@@ -105,7 +220,7 @@ class VersionCatalog:
         return versions
 
     def _quilt_versions(self, stable_only: bool) -> list[str]:
-        entries = self.http_client.get_json(f"{QUILT_META}/game")
+        entries = self._get_json(f"{QUILT_META}/game")
         versions: list[str] = []
         for entry in entries:
             version = str(entry.get("version", ""))
@@ -117,47 +232,47 @@ class VersionCatalog:
         return versions
 
     def _forge_metadata_versions(self) -> list[str]:
-        xml_text = self.http_client.get_text(FORGE_METADATA_URL)
-        root = ET.fromstring(xml_text)
-        return [
-            item.text
-            for item in root.findall("./versioning/versions/version")
-            if item.text
-        ]
+        return self._maven_metadata_versions(FORGE_METADATA_URL)
 
     def _neoforge_metadata_versions(self) -> list[str]:
-        xml_text = self.http_client.get_text(NEOFORGE_METADATA_URL)
-        root = ET.fromstring(xml_text)
-        return [
-            item.text
-            for item in root.findall("./versioning/versions/version")
-            if item.text
-        ]
+        return self._maven_metadata_versions(NEOFORGE_METADATA_URL)
 
-    def _forge_mc_versions(self, stable_only: bool) -> list[str]:
-        versions = self._forge_metadata_versions()
-        mc_versions: list[str] = []
-        for version in versions:
-            if stable_only and not is_stable_version(version):
-                continue
-            if "-" not in version:
-                continue
-            mc_versions.append(version.split("-", 1)[0])
-        return mc_versions
+    def _maven_metadata_versions(self, url: str) -> list[str]:
+        # Cache the parsed version list rather than the raw XML so the
+        # MC-version and loader-version queries share a single parse.
+        def _fetch() -> list[str]:
+            versions: list[str] = []
+            in_versions = False
+            with self.http_client.get_stream(url) as stream:
+                for event, elem in ET.iterparse(stream, events=("start", "end")):
+                    if elem.tag == "versions":
+                        in_versions = event == "start"
+                    elif event == "end" and elem.tag == "version" and in_versions:
+                        if elem.text:
+                            versions.append(elem.text)
+                        elem.clear()
+            return versions
 
-    def _neoforge_mc_versions(self, stable_only: bool) -> list[str]:
-        versions = self._neoforge_metadata_versions()
-        mc_versions: list[str] = []
-        for version in versions:
-            if stable_only and not is_stable_version(version):
-                continue
-            mapped = self._map_neoforge_to_mc(version)
-            if mapped:
-                mc_versions.append(mapped)
-        return mc_versions
+        return self._cached(url, _fetch)
+
+    def _forge_mc_versions(self, stable_only: bool) -> set[str]:
+        return {
+            version.split("-", 1)[0]
+            for version in self._forge_metadata_versions()
+            if "-" in version and (not stable_only or is_stable_version(version))
+        }
+
+    def _neoforge_mc_versions(self, stable_only: bool) -> set[str]:
+        mapped = {
+            self._map_neoforge_to_mc(version)
+            for version in self._neoforge_metadata_versions()
+            if not stable_only or is_stable_version(version)
+        }
+        mapped.discard(None)
+        return mapped  # type: ignore[return-value]
 
     def _fabric_loader_versions(self, minecraft_version: str, stable_only: bool) -> list[str]:
-        entries = self.http_client.get_json(f"{FABRIC_META}/loader/{minecraft_version}")
+        entries = self._get_json(f"{FABRIC_META}/loader/{minecraft_version}")
         versions: list[str] = []
         for entry in entries:
             loader = entry.get("loader") or {}
@@ -170,7 +285,7 @@ class VersionCatalog:
         return versions
 
     def _quilt_loader_versions(self, minecraft_version: str) -> list[str]:
-        entries = self.http_client.get_json(f"{QUILT_META}/loader/{minecraft_version}")
+        entries = self._get_json(f"{QUILT_META}/loader/{minecraft_version}")
         versions: list[str] = []
         for entry in entries:
             loader = entry.get("loader") or {}
@@ -198,7 +313,9 @@ class VersionCatalog:
                 matches.append(version)
         return matches
 
-    def _map_neoforge_to_mc(self, neoforge_version: str) -> str | None:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _map_neoforge_to_mc(neoforge_version: str) -> str | None:
         parts = neoforge_version.split(".")
         if len(parts) < 2:
             return None
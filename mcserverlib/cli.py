@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 import sys
-import time
+from typing import TYPE_CHECKING
 
-from .manager import ServerManager
-from .models import InstallRequest
+if TYPE_CHECKING:
+    from .manager import ServerManager
 
 
 def _parse_properties(items: list[str] | None) -> dict[str, str] | None:
@@ -15,13 +14,27 @@ def _parse_properties(items: list[str] | None) -> dict[str, str] | None:
         return None
     parsed: dict[str, str] = {}
     for item in items:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             raise ValueError(f"Invalid property '{item}'. Expected key=value.")
-        key, value = item.split("=", 1)
         parsed[key.strip()] = value.strip()
     return parsed
 
 
+def _print_json(payload: dict[str, object]) -> None:
+    from .utils import dumps_json
+
+    data = dumps_json(payload)
+    # Replaced streams (redirect_stdout, IDE consoles) may be text-only.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
 def _cmd_loaders(manager: ServerManager) -> int:
     for loader in manager.supported_loaders:
         print(loader)
@@ -29,6 +42,8 @@ def _cmd_loaders(manager: ServerManager) -> int:
 
 
 def _cmd_install(args: argparse.Namespace, manager: ServerManager) -> int:
+    from .models import InstallRequest
+
     server_properties = _parse_properties(args.property)
     request = InstallRequest(
         loader=args.loader,
@@ -52,13 +67,13 @@ def _cmd_install(args: argparse.Namespace, manager: ServerManager) -> int:
         "server_jar": str(result.server_jar) if result.server_jar else None,
         "notes": result.notes,
     }
-    print(json.dumps(payload, indent=2))
+    _print_json(payload)
     return 0
 
 
 def _cmd_manifest(args: argparse.Namespace, manager: ServerManager) -> int:
     manifest = manager.load_manifest(Path(args.dir).resolve())
-    print(json.dumps(manifest.to_dict(), indent=2))
+    _print_json(manifest.to_dict())
     return 0
 
 
@@ -82,9 +97,8 @@ def _cmd_start(args: argparse.Namespace, manager: ServerManager) -> int:
         return return_code
     except KeyboardInterrupt:
         print("Stopping server...")
+        # stop() waits for the exit itself, escalating to terminate/kill.
         code = process.stop(graceful_timeout=30.0)
-        while process.is_running():
-            time.sleep(0.2)
         print(f"Server stopped with code {code}.")
         return 0
 
@@ -162,10 +176,22 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv == ["loaders"]:
+        # Hot path: skip building the full argparse tree for a bare listing.
+        from .manager import ServerManager
+
+        return _cmd_loaders(ServerManager())
+
     parser = build_parser()
     args = parser.parse_args(argv)
-    manager = ServerManager()
+    if args.command == "gui":
+        return _cmd_gui()
+
+    from .manager import ServerManager
 
+    manager = ServerManager()
     if args.command == "loaders":
         return _cmd_loaders(manager)
     if args.command == "install":
@@ -174,8 +200,6 @@ def main(argv: list[str] | None = None) -> int:
         return _cmd_manifest(args, manager)
     if args.command == "start":
         return _cmd_start(args, manager)
-    if args.command == "gui":
-        return _cmd_gui()
     parser.print_help()
     return 2
 
@@ -1,49 +1,559 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-import json
+import atexit
+import os
 import queue
 import socket
+import subprocess
 import sys
 import threading
-import traceback
+import time
 import tkinter as tk
 import tkinter.font as tkfont
-import urllib.parse
 from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
-import webbrowser
+import traceback
+from typing import Callable
+import urllib.parse
 
 try:
     from .catalog import VersionCatalog
     from .manager import ServerManager
     from .models import InstallRequest, InstallResult
     from .process import ServerProcess
-    from .utils import read_server_endpoint
+    from .utils import dumps_json, loads_json, read_server_endpoint
 except ImportError:  # pragma: no cover - fallback for direct/frozen entry
     from mcserverlib.catalog import VersionCatalog
     from mcserverlib.manager import ServerManager
     from mcserverlib.models import InstallRequest, InstallResult
     from mcserverlib.process import ServerProcess
-    from mcserverlib.utils import read_server_endpoint
+    from mcserverlib.utils import dumps_json, loads_json, read_server_endpoint
 
 DISCORD_URL = "https://discord.gg/AqUmRUshhK"
 WEBSITE_URL = "https://TrulyKing.dev"
-ALLOWED_EXTERNAL_HOSTS = {"discord.gg", "trulyking.dev", "www.trulyking.dev"}
+ALLOWED_EXTERNAL_HOSTS = frozenset({"discord.gg", "trulyking.dev", "www.trulyking.dev"})
 ASSETS_DIRNAME = "assets"
+_LOADER_VERSION_LOADERS = frozenset({"fabric", "quilt", "forge", "neoforge"})
+_BUILD_LOADERS = frozenset({"paper", "folia", "purpur"})
+# (loader version combobox, refresh loader versions button, build entry)
+_OPTIONAL_FIELDS_DISABLED = ("disabled", "disabled", "disabled")
+_LOADER_WIDGET_STATE: dict[str, tuple[str, str, str]] = {
+    loader: (
+        "normal" if loader in _LOADER_VERSION_LOADERS else "disabled",
+        "normal" if loader in _LOADER_VERSION_LOADERS else "disabled",
+        "normal" if loader in _BUILD_LOADERS else "disabled",
+    )
+    for loader in _LOADER_VERSION_LOADERS | _BUILD_LOADERS
+}
 LOGO_CANDIDATE_NAMES = (
+    "logo@84.png",
     "logo.png",
     "logo.jpg",
     "logo.jpeg",
     "kings-logo.png",
 )
+UI_QUEUE_BATCH_LIMIT = 200
+UI_QUEUE_EVENT = "<<UiQueue>>"
+UI_QUEUE_SAFETY_INTERVAL_MS = 500
+SETTINGS_WRITE_DELAY_SECONDS = 0.5
+ENDPOINT_REFRESH_DELAY_MS = 250
+LOADER_VERSION_REFRESH_DELAY_MS = 200
+LOG_MAX_LINES = 5000
+LOG_TRIM_TO_LINES = 4000
+PROGRESS_INTERVAL_MS = 80
+PROGRESS_START_DELAY_MS = 150
+LAN_IP_CACHE_TTL_SECONDS = 60.0
+ENDPOINT_CACHE_SIZE = 8
+VERSION_CACHE_TTL_SECONDS = 900.0
+VERSION_LIST_TTL_SECONDS = 300.0
+VERSION_CACHE_DIRNAME = "cache"
+TASK_POOL_WORKERS = 4
+PREFETCH_VERSION_COUNT = 5
+PREFETCH_POOL_WORKERS = 1
+# Loaders whose version list is a separate request per Minecraft version;
+# forge/neoforge filter one shared document, so prefetching them gains nothing.
+_PREFETCH_LOADERS = frozenset({"fabric", "quilt"})
+# Read-only catalog lookups that may overlap each other, but never an install,
+# start or stop.
+_CONCURRENT_TASKS = frozenset({"refresh_versions", "refresh_loader_versions"})
+_LOG_NAVIGATION_KEYS = frozenset(
+    {"Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next", "Tab"}
+)
+_LOG_COPY_KEYS = frozenset({"c", "C", "a", "A", "Insert"})
+_COPY_MODIFIER_MASK = 0x8 if sys.platform == "darwin" else 0x4
 ICON_CANDIDATE_NAMES = (
+    "icon@128.png",
     "icon.png",
     "kings-icon.png",
     "logo.png",
 )
 
 
+PALETTE = {
+    "app_bg": "#080D18",
+    "header_bg": "#0E1528",
+    "card_bg": "#10192C",
+    "input_bg": "#131F35",
+    "console_bg": "#0B0F17",
+    "text_primary": "#EAF1FF",
+    "text_secondary": "#A2B2D2",
+    "text_muted": "#7D8DAF",
+    "accent": "#3C7BFF",
+    "accent_hover": "#4D89FF",
+    "accent_pressed": "#2F67DD",
+    "danger": "#D84F5B",
+    "danger_hover": "#E0636E",
+    "danger_pressed": "#B8404A",
+    "neutral": "#1A2641",
+    "neutral_hover": "#213152",
+    "neutral_pressed": "#17253F",
+    "banner_bg": "#2A1217",
+    "banner_fg": "#FF7A86",
+    "progress_trough": "#0E1628",
+    "progress_fill": "#4D93FF",
+    "state_online": "#3FC272",
+    "state_offline": "#6A7794",
+}
+
+# Tk's built-in named fonts, retargeted instead of an option-database "*Font".
+_TK_DEFAULT_FONT_ROLES = (
+    ("TkDefaultFont", "base"),
+    ("TkTextFont", "base"),
+    ("TkMenuFont", "base"),
+    ("TkFixedFont", "mono"),
+)
+
+# Named Tk fonts shared by the styles below and the console, as (role, size).
+# _configure_style creates them once the installed families are known.
+FONT_SPECS: dict[str, tuple[str, int]] = {
+    "KSL.Title": ("semibold", 19),
+    "KSL.CardTitle": ("semibold", 15),
+    "KSL.CardSub": ("base", 12),
+    "KSL.Subtitle": ("base", 11),
+    "KSL.StatusKey": ("semibold", 11),
+    "KSL.Label": ("semibold", 10),
+    "KSL.Body": ("base", 10),
+    "KSL.Meta": ("base", 9),
+    "KSL.Mono": ("mono", 10),
+}
+
+STYLE_SPECS: tuple[tuple[str, dict[str, object]], ...] = (
+    ("App.TFrame", {"background": PALETTE["app_bg"]}),
+    ("HeaderCard.TFrame", {"background": PALETTE["header_bg"], "relief": "flat"}),
+    ("Card.TFrame", {"background": PALETTE["card_bg"], "relief": "flat"}),
+    ("Banner.TFrame", {"background": PALETTE["banner_bg"], "relief": "flat"}),
+    ("Logo.TLabel", {"background": PALETTE["header_bg"]}),
+    (
+        "HeaderTitle.TLabel",
+        {
+            "background": PALETTE["header_bg"],
+            "foreground": PALETTE["text_primary"],
+            "font": "KSL.Title",
+        },
+    ),
+    (
+        "HeaderSub.TLabel",
+        {
+            "background": PALETTE["header_bg"],
+            "foreground": PALETTE["text_secondary"],
+            "font": "KSL.Subtitle",
+        },
+    ),
+    (
+        "Banner.TLabel",
+        {
+            "background": PALETTE["banner_bg"],
+            "foreground": PALETTE["banner_fg"],
+            "font": "KSL.Label",
+        },
+    ),
+    (
+        "CardTitle.TLabel",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_primary"],
+            "font": "KSL.CardTitle",
+        },
+    ),
+    (
+        "CardSub.TLabel",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_secondary"],
+            "font": "KSL.CardSub",
+        },
+    ),
+    (
+        "FieldLabel.TLabel",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_primary"],
+            "font": "KSL.Label",
+        },
+    ),
+    (
+        "Meta.TLabel",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_secondary"],
+            "font": "KSL.Meta",
+        },
+    ),
+    (
+        "StatusKey.TLabel",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_muted"],
+            "font": "KSL.StatusKey",
+        },
+    ),
+    (
+        "StatusValue.TLabel",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_primary"],
+            "font": "KSL.Subtitle",
+        },
+    ),
+    (
+        "ConsoleState.TLabel",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_secondary"],
+            "font": "KSL.Label",
+        },
+    ),
+    (
+        "Input.TEntry",
+        {
+            "fieldbackground": PALETTE["input_bg"],
+            "foreground": PALETTE["text_primary"],
+            "borderwidth": 0,
+            "relief": "flat",
+            "padding": (12, 9),
+        },
+    ),
+    (
+        "Placeholder.TEntry",
+        {
+            "fieldbackground": PALETTE["input_bg"],
+            "foreground": PALETTE["text_muted"],
+            "borderwidth": 0,
+            "relief": "flat",
+            "padding": (12, 9),
+        },
+    ),
+    (
+        "Input.TCombobox",
+        {
+            "fieldbackground": PALETTE["input_bg"],
+            "foreground": PALETTE["text_primary"],
+            "arrowsize": 16,
+            "borderwidth": 0,
+            "relief": "flat",
+            "padding": (12, 9),
+        },
+    ),
+    (
+        "Primary.TButton",
+        {
+            "font": "KSL.Label",
+            "padding": (12, 10),
+            "background": PALETTE["accent"],
+            "foreground": "#FFFFFF",
+            "borderwidth": 0,
+        },
+    ),
+    (
+        "Secondary.TButton",
+        {
+            "font": "KSL.Label",
+            "padding": (12, 10),
+            "background": PALETTE["neutral"],
+            "foreground": PALETTE["text_primary"],
+            "borderwidth": 0,
+        },
+    ),
+    (
+        "Danger.TButton",
+        {
+            "font": "KSL.Label",
+            "padding": (12, 10),
+            "background": PALETTE["danger"],
+            "foreground": "#FFFFFF",
+            "borderwidth": 0,
+        },
+    ),
+    (
+        "Link.TButton",
+        {
+            "font": "KSL.Label",
+            "padding": (12, 9),
+            "background": PALETTE["neutral"],
+            "foreground": PALETTE["text_primary"],
+            "borderwidth": 0,
+        },
+    ),
+    (
+        "TCheckbutton",
+        {
+            "background": PALETTE["card_bg"],
+            "foreground": PALETTE["text_primary"],
+            "font": "KSL.Body",
+        },
+    ),
+    (
+        "Launch.Horizontal.TProgressbar",
+        {
+            "troughcolor": PALETTE["progress_trough"],
+            "background": PALETTE["progress_fill"],
+            "lightcolor": PALETTE["progress_fill"],
+            "darkcolor": PALETTE["progress_fill"],
+            "bordercolor": PALETTE["progress_trough"],
+        },
+    ),
+    (
+        "Launch.Vertical.TScrollbar",
+        {
+            "gripcount": 0,
+            "troughcolor": "#0D1424",
+            "background": "#263754",
+            "darkcolor": "#1F2E48",
+            "lightcolor": "#324A72",
+            "bordercolor": "#0D1424",
+            "arrowcolor": "#A8BBE4",
+        },
+    ),
+)
+
+STYLE_MAPS: tuple[tuple[str, dict[str, list[tuple[str, str]]]], ...] = (
+    (
+        "Input.TEntry",
+        {
+            "fieldbackground": [
+                ("focus", "#1A2A46"),
+                ("readonly", "#17253E"),
+                ("disabled", "#121A2C"),
+            ],
+            "foreground": [("disabled", "#6D7C9A")],
+        },
+    ),
+    (
+        "Input.TCombobox",
+        {
+            "fieldbackground": [
+                ("readonly", "#17253E"),
+                ("focus", "#1A2A46"),
+                ("disabled", "#121A2C"),
+            ],
+            "foreground": [("readonly", PALETTE["text_primary"]), ("disabled", "#6D7C9A")],
+        },
+    ),
+    (
+        "Primary.TButton",
+        {
+            "background": [
+                ("pressed", PALETTE["accent_pressed"]),
+                ("active", PALETTE["accent_hover"]),
+                ("disabled", "#27314C"),
+            ],
+            "foreground": [("disabled", "#8FA1C5")],
+        },
+    ),
+    (
+        "Secondary.TButton",
+        {
+            "background": [
+                ("pressed", PALETTE["neutral_pressed"]),
+                ("active", PALETTE["neutral_hover"]),
+                ("disabled", "#1C263D"),
+            ],
+            "foreground": [("disabled", "#7486AB")],
+        },
+    ),
+    (
+        "Danger.TButton",
+        {
+            "background": [
+                ("pressed", PALETTE["danger_pressed"]),
+                ("active", PALETTE["danger_hover"]),
+                ("disabled", "#3B2A35"),
+            ],
+            "foreground": [("disabled", "#B6979E")],
+        },
+    ),
+    (
+        "Link.TButton",
+        {
+            "background": [
+                ("pressed", PALETTE["neutral_pressed"]),
+                ("active", PALETTE["neutral_hover"]),
+                ("disabled", "#1C263D"),
+            ],
+            "foreground": [("disabled", "#7486AB")],
+        },
+    ),
+    (
+        "TCheckbutton",
+        {
+            "background": [("active", PALETTE["card_bg"]), ("disabled", PALETTE["card_bg"])],
+            "foreground": [("disabled", "#6A80A8")],
+        },
+    ),
+)
+
+
+_field_label = partial(ttk.Label, style="FieldLabel.TLabel")
+_card_title = partial(ttk.Label, style="CardTitle.TLabel")
+_card_subtitle = partial(ttk.Label, style="CardSub.TLabel")
+
+
+BASE_FONT_CANDIDATES = ("Inter", "Segoe UI Variable Text", "Segoe UI")
+MONO_FONT_CANDIDATES = ("JetBrains Mono", "Cascadia Code", "Consolas")
+SEMIBOLD_FONT_CANDIDATES = ("Inter SemiBold", "Segoe UI Semibold")
+
+
+def _first_available(candidates: tuple[str, ...], available: frozenset[str], default: str) -> str:
+    return next((name for name in candidates if name in available), default)
+
+
+def _is_safe_external_url(url: str) -> bool:
+    parsed = urllib.parse.urlsplit(url)
+    host = (parsed.hostname or "").lower()
+    return parsed.scheme.lower() == "https" and host in ALLOWED_EXTERNAL_HOSTS
+
+
+# The launcher only ever opens these constants, so vet them once at import.
+SAFE_EXTERNAL_URLS = frozenset(
+    url for url in (DISCORD_URL, WEBSITE_URL) if _is_safe_external_url(url)
+)
+
+
+@lru_cache(maxsize=16)
+def _format_host_port(host: str, port: int) -> str:
+    if ":" in host and not host.startswith("["):
+        return f"[{host}]:{port}"
+    return f"{host}:{port}"
+
+
+@lru_cache(maxsize=1)
+def _project_root() -> Path:
+    return Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=1)
+def _asset_search_roots() -> tuple[Path, ...]:
+    roots: list[Path] = []
+    if getattr(sys, "frozen", False):
+        meipass = getattr(sys, "_MEIPASS", None)
+        if meipass:
+            roots.append(Path(meipass))
+        roots.append(Path(sys.executable).resolve().parent)
+    roots.append(_project_root())
+    return tuple(roots)
+
+
+@lru_cache(maxsize=4)
+def _resolve_brand_asset(roots: tuple[Path, ...], candidates: tuple[str, ...]) -> Path | None:
+    for root in roots:
+        assets_dir = root / ASSETS_DIRNAME
+        try:
+            entries = set(os.listdir(assets_dir))
+        except OSError:
+            continue
+        for name in candidates:
+            if name in entries:
+                return assets_dir / name
+    return None
+
+
+_PoolJob = tuple[Future, Callable[..., object], tuple]
+
+
+class _DaemonTaskPool:
+    """Tiny executor whose workers are daemon threads.
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so closing the
+    window mid-install would leave a windowless process running until the
+    download finished. Daemon workers die with the interpreter instead.
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        self._max_workers = max_workers
+        self._name = name
+        self._jobs: queue.SimpleQueue[_PoolJob | None] = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, fn: Callable[..., object], /, *args: object) -> Future[object]:
+        future: Future[object] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            self._jobs.put((future, fn, args))
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"{self._name}-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and let idle workers exit; never waits."""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None:
+                    job[0].cancel()
+            for _ in self._workers:
+                self._jobs.put(None)
+
+
+@dataclass(slots=True)
+class LauncherVars:
+    instance_dir: tk.StringVar
+    loader: tk.StringVar
+    mc_version: tk.StringVar
+    loader_version: tk.StringVar
+    build: tk.StringVar
+    java_path: tk.StringVar
+    accept_eula: tk.BooleanVar
+    xms: tk.StringVar
+    xmx: tk.StringVar
+    console_command: tk.StringVar
+    status: tk.StringVar
+    server_endpoint: tk.StringVar
+    console_state: tk.StringVar
+
+
 class LauncherApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -54,34 +564,73 @@ class LauncherApp(tk.Tk):
         self.manager = ServerManager()
         self.catalog = VersionCatalog(http_client=self.manager.http_client)
 
-        self._ui_queue: queue.Queue[tuple[str, object]] = queue.Queue()
-        self._worker: threading.Thread | None = None
+        # deque.append/popleft are atomic, so worker threads and the Tk thread
+        # can share it without a lock.
+        self._ui_queue: deque[tuple[str, object]] = deque()
+        self._destroyed = False
+        self._ui_wakeup_pending = False
+        self._task_pool = _DaemonTaskPool(TASK_POOL_WORKERS, "launcher-task")
+        # Speculative work gets its own lane so it never delays user tasks.
+        self._prefetch_pool = _DaemonTaskPool(PREFETCH_POOL_WORKERS, "launcher-prefetch")
+        self._inflight: dict[str, Future[object]] = {}
         self._server_process: ServerProcess | None = None
         self._settings_path = Path.home() / ".kingsserverlauncher" / "settings.json"
+        self._settings_state: dict[str, str] | None = None
+        self._settings_lock = threading.Lock()
+        # Serializes flushes only; the Tk thread never waits on file I/O.
+        self._settings_io_lock = threading.Lock()
+        self._settings_dirty = threading.Event()
+        self._settings_writer: threading.Thread | None = None
+        self._last_saved_settings: dict[str, str] | None = None
+        self._settings_mtime_ns: int | None = None
         initial_instance_dir = self._load_saved_instance_dir()
         self._storage_selected = bool(initial_instance_dir)
 
-        self.instance_dir_var = tk.StringVar(value=initial_instance_dir)
-        self.loader_var = tk.StringVar(value="paper")
-        self.mc_version_var = tk.StringVar(value="latest")
-        self.loader_version_var = tk.StringVar(value="")
-        self.build_var = tk.StringVar(value="")
-        self.java_path_var = tk.StringVar(value="java")
-        self.accept_eula_var = tk.BooleanVar(value=True)
-        self.xms_var = tk.StringVar(value="2G")
-        self.xmx_var = tk.StringVar(value="4G")
-        self.console_command_var = tk.StringVar(value="")
-        self.status_var = tk.StringVar(value="Ready")
-        self.server_endpoint_var = tk.StringVar(value="Choose a folder")
-        self.console_state_var = tk.StringVar(value="Offline")
+        self.vars = LauncherVars(
+            instance_dir=tk.StringVar(value=initial_instance_dir),
+            loader=tk.StringVar(value="paper"),
+            mc_version=tk.StringVar(value="latest"),
+            loader_version=tk.StringVar(value=""),
+            build=tk.StringVar(value=""),
+            java_path=tk.StringVar(value="java"),
+            accept_eula=tk.BooleanVar(value=True),
+            xms=tk.StringVar(value="2G"),
+            xmx=tk.StringVar(value="4G"),
+            console_command=tk.StringVar(value=""),
+            status=tk.StringVar(value="Ready"),
+            server_endpoint=tk.StringVar(value="Choose a folder"),
+            console_state=tk.StringVar(value="Offline"),
+        )
         self._controls_busy = False
+        self._log_line_count = 0
+        self._last_status = self.vars.status.get()
+        self._last_endpoint = self.vars.server_endpoint.get()
+        self._combo_values: dict[str, tuple[str, ...]] = {}
+        self._widget_states: dict[str, str] = {}
+        self._console_style: str | None = None
+        self._indicator_running: bool | None = None
+        self._version_lists: dict[tuple[str, ...], tuple[float, list[str]]] = {}
+        self._prefetching: set[tuple[str, str]] = set()
+        self._progress_start_id: str | None = None
+        self._progress_running = False
+        self._task_handlers: dict[str, Callable[[object], None]] = {
+            "refresh_versions": self._on_refresh_versions,
+            "refresh_loader_versions": self._on_refresh_loader_versions,
+            "install": self._on_install,
+            "start": self._on_start,
+            "stop": self._on_stop,
+        }
         self._command_placeholder = "Type a command..."
         self._command_placeholder_active = False
         self._logo_image: tk.PhotoImage | None = None
         self._window_icon_image: tk.PhotoImage | None = None
+        self._endpoint_refresh_id: str | None = None
+        self._loader_refresh_id: str | None = None
+        self._last_refreshed_dir: str | None = None
+        self._endpoint_cache: dict[str, tuple[int, int, str, int]] = {}
+        self._lan_ip_cache: tuple[float, str | None] | None = None
+        self._lan_ip_pending = False
 
-        self._load_brand_assets()
-        self._apply_window_icon()
         self._configure_style()
         self._build_menu()
         self._build_ui()
@@ -94,303 +643,80 @@ class LauncherApp(tk.Tk):
             "Welcome to KingsServerLauncher. Choose your folder, loader, and version."
         )
 
-        self.after(100, self._poll_ui_queue)
-        self.after(1000, self._poll_process_state)
-        self.after(150, self._ensure_storage_selected_on_startup)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind(UI_QUEUE_EVENT, lambda _event: self._drain_ui_queue())
+        self.after(UI_QUEUE_SAFETY_INTERVAL_MS, self._poll_ui_queue)
+        self.after_idle(self._startup_tasks)
+
+    def _startup_tasks(self) -> None:
+        # Runs once the first frame is mapped. Background work is submitted
+        # before the storage prompt, which is modal and blocks this callback.
+        self._kick_off_asset_load()
         self._refresh_versions()
+        self._ensure_storage_selected_on_startup()
 
     def _configure_style(self) -> None:
         style = ttk.Style(self)
-        available_themes = set(style.theme_names())
+        available_themes = style.theme_names()
         for candidate in ("clam", "vista", "winnative"):
             if candidate in available_themes:
                 style.theme_use(candidate)
                 break
 
-        available_fonts = set(tkfont.families(self))
-        for candidate in ("Inter", "Segoe UI Variable Text", "Segoe UI"):
-            if candidate in available_fonts:
-                base_font = candidate
-                break
-        else:
-            base_font = "TkDefaultFont"
-        mono_font = "JetBrains Mono" if "JetBrains Mono" in available_fonts else "Cascadia Code"
-        if mono_font not in available_fonts:
-            mono_font = "Consolas" if "Consolas" in available_fonts else "TkFixedFont"
-        semibold_font = (
-            "Inter SemiBold"
-            if "Inter SemiBold" in available_fonts
-            else ("Segoe UI Semibold" if "Segoe UI Semibold" in available_fonts else base_font)
-        )
-        title_font = (
-            "Inter SemiBold"
-            if "Inter SemiBold" in available_fonts
-            else ("Segoe UI Semibold" if "Segoe UI Semibold" in available_fonts else base_font)
-        )
-
-        self.option_add("*Font", f"{{{base_font}}} 10")
-        self._mono_font = mono_font
-
-        self._colors = {
-            "app_bg": "#080D18",
-            "header_bg": "#0E1528",
-            "card_bg": "#10192C",
-            "input_bg": "#131F35",
-            "console_bg": "#0B0F17",
-            "text_primary": "#EAF1FF",
-            "text_secondary": "#A2B2D2",
-            "text_muted": "#7D8DAF",
-            "accent": "#3C7BFF",
-            "accent_hover": "#4D89FF",
-            "accent_pressed": "#2F67DD",
-            "danger": "#D84F5B",
-            "danger_hover": "#E0636E",
-            "danger_pressed": "#B8404A",
-            "neutral": "#1A2641",
-            "neutral_hover": "#213152",
-            "neutral_pressed": "#17253F",
-            "banner_bg": "#2A1217",
-            "banner_fg": "#FF7A86",
-            "progress_trough": "#0E1628",
-            "progress_fill": "#4D93FF",
-            "state_online": "#3FC272",
-            "state_offline": "#6A7794",
-        }
-        colors = self._colors
-
-        self.configure(bg=colors["app_bg"])
-
-        style.configure("App.TFrame", background=colors["app_bg"])
-        style.configure("HeaderCard.TFrame", background=colors["header_bg"], relief="flat")
-        style.configure("Card.TFrame", background=colors["card_bg"], relief="flat")
-        style.configure("Banner.TFrame", background=colors["banner_bg"], relief="flat")
-        style.configure("Logo.TLabel", background=colors["header_bg"])
-        style.configure(
-            "HeaderTitle.TLabel",
-            background=colors["header_bg"],
-            foreground=colors["text_primary"],
-            font=(title_font, 19),
-        )
-        style.configure(
-            "HeaderSub.TLabel",
-            background=colors["header_bg"],
-            foreground=colors["text_secondary"],
-            font=(base_font, 11),
-        )
-        style.configure(
-            "Banner.TLabel",
-            background=colors["banner_bg"],
-            foreground=colors["banner_fg"],
-            font=(semibold_font, 10),
-        )
-        style.configure(
-            "CardTitle.TLabel",
-            background=colors["card_bg"],
-            foreground=colors["text_primary"],
-            font=(semibold_font, 15),
-        )
-        style.configure(
-            "CardSub.TLabel",
-            background=colors["card_bg"],
-            foreground=colors["text_secondary"],
-            font=(base_font, 12),
-        )
-        style.configure(
-            "FieldLabel.TLabel",
-            background=colors["card_bg"],
-            foreground=colors["text_primary"],
-            font=(semibold_font, 10),
-        )
-        style.configure(
-            "Meta.TLabel",
-            background=colors["card_bg"],
-            foreground=colors["text_secondary"],
-            font=(base_font, 9),
-        )
-        style.configure(
-            "StatusKey.TLabel",
-            background=colors["card_bg"],
-            foreground=colors["text_muted"],
-            font=(semibold_font, 11),
-        )
-        style.configure(
-            "StatusValue.TLabel",
-            background=colors["card_bg"],
-            foreground=colors["text_primary"],
-            font=(base_font, 11),
-        )
-        style.configure(
-            "ConsoleState.TLabel",
-            background=colors["card_bg"],
-            foreground=colors["text_secondary"],
-            font=(semibold_font, 10),
-        )
-        style.configure(
-            "Input.TEntry",
-            fieldbackground=colors["input_bg"],
-            foreground=colors["text_primary"],
-            borderwidth=0,
-            relief="flat",
-            padding=(12, 9),
-        )
-        style.map(
-            "Input.TEntry",
-            fieldbackground=[
-                ("focus", "#1A2A46"),
-                ("readonly", "#17253E"),
-                ("disabled", "#121A2C"),
-            ],
-            foreground=[("disabled", "#6D7C9A")],
-        )
-        style.configure(
-            "Placeholder.TEntry",
-            fieldbackground=colors["input_bg"],
-            foreground=colors["text_muted"],
-            borderwidth=0,
-            relief="flat",
-            padding=(12, 9),
-        )
-        style.configure(
-            "Input.TCombobox",
-            fieldbackground=colors["input_bg"],
-            foreground=colors["text_primary"],
-            arrowsize=16,
-            borderwidth=0,
-            relief="flat",
-            padding=(12, 9),
-        )
-        style.map(
-            "Input.TCombobox",
-            fieldbackground=[
-                ("readonly", "#17253E"),
-                ("focus", "#1A2A46"),
-                ("disabled", "#121A2C"),
-            ],
-            foreground=[("readonly", colors["text_primary"]), ("disabled", "#6D7C9A")],
-        )
-        style.configure(
-            "Primary.TButton",
-            font=(semibold_font, 10),
-            padding=(12, 10),
-            background=colors["accent"],
-            foreground="#FFFFFF",
-            borderwidth=0,
-        )
-        style.map(
-            "Primary.TButton",
-            background=[
-                ("pressed", colors["accent_pressed"]),
-                ("active", colors["accent_hover"]),
-                ("disabled", "#27314C"),
-            ],
-            foreground=[("disabled", "#8FA1C5")],
-        )
-        style.configure(
-            "Secondary.TButton",
-            font=(semibold_font, 10),
-            padding=(12, 10),
-            background=colors["neutral"],
-            foreground=colors["text_primary"],
-            borderwidth=0,
-        )
-        style.map(
-            "Secondary.TButton",
-            background=[
-                ("pressed", colors["neutral_pressed"]),
-                ("active", colors["neutral_hover"]),
-                ("disabled", "#1C263D"),
-            ],
-            foreground=[("disabled", "#7486AB")],
-        )
-        style.configure(
-            "Danger.TButton",
-            font=(semibold_font, 10),
-            padding=(12, 10),
-            background=colors["danger"],
-            foreground="#FFFFFF",
-            borderwidth=0,
-        )
-        style.map(
-            "Danger.TButton",
-            background=[
-                ("pressed", colors["danger_pressed"]),
-                ("active", colors["danger_hover"]),
-                ("disabled", "#3B2A35"),
-            ],
-            foreground=[("disabled", "#B6979E")],
-        )
-        style.configure(
-            "Link.TButton",
-            font=(semibold_font, 10),
-            padding=(12, 9),
-            background=colors["neutral"],
-            foreground=colors["text_primary"],
-            borderwidth=0,
-        )
-        style.map(
-            "Link.TButton",
-            background=[
-                ("pressed", colors["neutral_pressed"]),
-                ("active", colors["neutral_hover"]),
-                ("disabled", "#1C263D"),
-            ],
-            foreground=[("disabled", "#7486AB")],
-        )
-        style.configure(
-            "TCheckbutton",
-            background=colors["card_bg"],
-            foreground=colors["text_primary"],
-            font=(base_font, 10),
-        )
-        style.map(
-            "TCheckbutton",
-            background=[("active", colors["card_bg"]), ("disabled", colors["card_bg"])],
-            foreground=[("disabled", "#6A80A8")],
-        )
-        style.configure(
-            "Launch.Horizontal.TProgressbar",
-            troughcolor=colors["progress_trough"],
-            background=colors["progress_fill"],
-            lightcolor=colors["progress_fill"],
-            darkcolor=colors["progress_fill"],
-            bordercolor=colors["progress_trough"],
-        )
-        style.configure(
-            "Launch.Vertical.TScrollbar",
-            gripcount=0,
-            troughcolor="#0D1424",
-            background="#263754",
-            darkcolor="#1F2E48",
-            lightcolor="#324A72",
-            bordercolor="#0D1424",
-            arrowcolor="#A8BBE4",
-        )
-
-    @staticmethod
-    def _project_root() -> Path:
-        return Path(__file__).resolve().parent.parent
-
-    def _asset_search_roots(self) -> list[Path]:
-        roots: list[Path] = []
-        if getattr(sys, "frozen", False):
-            meipass = getattr(sys, "_MEIPASS", None)
-            if meipass:
-                roots.append(Path(meipass))
-            roots.append(Path(sys.executable).resolve().parent)
-        roots.append(self._project_root())
-        return roots
-
-    def _resolve_brand_asset(self, candidates: tuple[str, ...]) -> Path | None:
-        for root in self._asset_search_roots():
-            assets_dir = root / ASSETS_DIRNAME
-            for name in candidates:
-                candidate = assets_dir / name
-                if candidate.exists():
-                    return candidate
-        return None
+        # Kept per instance: a module cache keyed on the root would pin it.
+        self._font_families = frozenset(tkfont.families(self))
+        available_fonts = self._font_families
+        base_font = _first_available(BASE_FONT_CANDIDATES, available_fonts, "TkDefaultFont")
+        mono_font = _first_available(MONO_FONT_CANDIDATES, available_fonts, "TkFixedFont")
+        semibold_font = _first_available(SEMIBOLD_FONT_CANDIDATES, available_fonts, base_font)
+        families = {"base": base_font, "semibold": semibold_font, "mono": mono_font}
+
+        for tk_name, role in _TK_DEFAULT_FONT_ROLES:
+            if not families[role].startswith("Tk"):
+                tkfont.nametofont(tk_name, root=self).configure(family=families[role], size=10)
+        self._fonts: dict[str, tkfont.Font] = {}
+        for name, (role, size) in FONT_SPECS.items():
+            self._fonts[name] = self._named_font(name, families[role], size)
+        self._colors = PALETTE
+        self.configure(bg=PALETTE["app_bg"])
+
+        for name, options in STYLE_SPECS:
+            style.configure(name, **options)
+        for name, options in STYLE_MAPS:
+            style.map(name, **options)
+
+    def _named_font(self, name: str, family: str, size: int) -> tkfont.Font:
+        if family.startswith("Tk"):
+            # Fallbacks such as TkFixedFont are font names, not families.
+            family = tkfont.nametofont(family, root=self).actual("family")
+        try:
+            return tkfont.Font(root=self, name=name, family=family, size=size, exists=False)
+        except tk.TclError:
+            font = tkfont.nametofont(name, root=self)
+            font.configure(family=family, size=size)
+            return font
 
     @staticmethod
     def _load_scaled_photo(path: Path, max_width: int) -> tk.PhotoImage | None:
+        # Pre-sized assets (logo@84.png, icon@128.png) are named for their
+        # width and decode straight into a PhotoImage; anything else is
+        # decoded once, by Pillow or by Tk followed by subsample.
+        if path.stem.endswith(f"@{max_width}"):
+            try:
+                return tk.PhotoImage(file=str(path))
+            except tk.TclError:
+                return None
+        try:
+            from PIL import Image, ImageTk  # type: ignore[import-untyped]
+        except ImportError:  # pragma: no cover - Pillow is optional
+            pass
+        else:
+            try:
+                with Image.open(path) as source:
+                    source.thumbnail((max_width, max_width), Image.Resampling.LANCZOS)
+                    return ImageTk.PhotoImage(source)
+            except (OSError, ValueError, tk.TclError):
+                pass
         try:
             image = tk.PhotoImage(file=str(path))
         except tk.TclError:
@@ -401,16 +727,25 @@ class LauncherApp(tk.Tk):
             image = image.subsample(sample, sample)
         return image
 
-    def _load_brand_assets(self) -> None:
-        logo_path = self._resolve_brand_asset(LOGO_CANDIDATE_NAMES)
+    def _kick_off_asset_load(self) -> None:
+        roots = _asset_search_roots()
+
+        def _resolve() -> None:
+            logo_path = _resolve_brand_asset(roots, LOGO_CANDIDATE_NAMES)
+            icon_path = _resolve_brand_asset(roots, ICON_CANDIDATE_NAMES) or logo_path
+            self._post_ui("brand_assets", (logo_path, icon_path))
+
+        threading.Thread(target=_resolve, name="launcher-assets", daemon=True).start()
+
+    def _load_brand_assets(self, logo_path: Path | None, icon_path: Path | None) -> None:
         if logo_path:
             self._logo_image = self._load_scaled_photo(logo_path, max_width=84)
-
-        icon_path = self._resolve_brand_asset(ICON_CANDIDATE_NAMES)
-        if not icon_path:
-            icon_path = logo_path
+            if self._logo_image is not None:
+                self._logo_label.configure(image=self._logo_image)
+                self._logo_label.grid()
         if icon_path:
             self._window_icon_image = self._load_scaled_photo(icon_path, max_width=128)
+            self._apply_window_icon()
 
     def _apply_window_icon(self) -> None:
         if self._window_icon_image is None:
@@ -482,16 +817,15 @@ class LauncherApp(tk.Tk):
         header.grid(row=0, column=0, sticky="ew")
         header.columnconfigure(1, weight=1)
         text_col = 1
-        if self._logo_image is not None:
-            ttk.Label(header, image=self._logo_image, style="Logo.TLabel").grid(
-                row=0,
-                column=0,
-                rowspan=2,
-                sticky="w",
-                padx=(0, section_gap),
-            )
-        else:
-            text_col = 0
+        self._logo_label = ttk.Label(header, style="Logo.TLabel")
+        self._logo_label.grid(
+            row=0,
+            column=0,
+            rowspan=2,
+            sticky="w",
+            padx=(0, section_gap),
+        )
+        self._logo_label.grid_remove()
         ttk.Label(header, text="KingsServerLauncher", style="HeaderTitle.TLabel").grid(
             row=0,
             column=text_col,
@@ -540,22 +874,21 @@ class LauncherApp(tk.Tk):
         left.columnconfigure(1, weight=1)
 
         row = 0
-        ttk.Label(left, text="Server Setup", style="CardTitle.TLabel").grid(
+        _card_title(left, text="Server Setup").grid(
             row=row, column=0, columnspan=2, sticky="w"
         )
         row += 1
-        ttk.Label(
+        _card_subtitle(
             left,
             text="Pick storage, loader, version, and runtime settings.",
-            style="CardSub.TLabel",
         ).grid(row=row, column=0, columnspan=2, sticky="w", pady=(6, section_gap))
 
         row += 1
-        ttk.Label(left, text="Server Storage", style="FieldLabel.TLabel").grid(
+        _field_label(left, text="Server Storage").grid(
             row=row, column=0, columnspan=2, sticky="w", pady=(0, 6)
         )
         row += 1
-        self.instance_dir_entry = ttk.Entry(left, textvariable=self.instance_dir_var, style="Input.TEntry")
+        self.instance_dir_entry = ttk.Entry(left, textvariable=self.vars.instance_dir, style="Input.TEntry")
         self.instance_dir_entry.grid(row=row, column=0, sticky="ew")
         self.browse_folder_btn = ttk.Button(
             left,
@@ -566,17 +899,17 @@ class LauncherApp(tk.Tk):
         self.browse_folder_btn.grid(row=row, column=1, sticky="ew", padx=(col_gap, 0))
 
         row += 1
-        ttk.Label(left, text="Loader", style="FieldLabel.TLabel").grid(
+        _field_label(left, text="Loader").grid(
             row=row, column=0, sticky="w", pady=(section_gap, 6)
         )
-        ttk.Label(left, text="Minecraft Version", style="FieldLabel.TLabel").grid(
+        _field_label(left, text="Minecraft Version").grid(
             row=row, column=1, sticky="w", padx=(col_gap, 0), pady=(section_gap, 6)
         )
         row += 1
         self.loader_combo = ttk.Combobox(
             left,
-            textvariable=self.loader_var,
-            values=list(self.manager.supported_loaders),
+            textvariable=self.vars.loader,
+            values=self.manager.supported_loaders,
             style="Input.TCombobox",
             state="readonly",
             width=20,
@@ -584,7 +917,7 @@ class LauncherApp(tk.Tk):
         self.loader_combo.grid(row=row, column=0, sticky="ew")
         self.mc_version_combo = ttk.Combobox(
             left,
-            textvariable=self.mc_version_var,
+            textvariable=self.vars.mc_version,
             values=["latest"],
             style="Input.TCombobox",
             state="readonly",
@@ -596,7 +929,7 @@ class LauncherApp(tk.Tk):
             left,
             text="Refresh Versions",
             style="Secondary.TButton",
-            command=self._refresh_versions,
+            command=partial(self._refresh_versions, force=True),
         )
         self.refresh_versions_btn.grid(
             row=row,
@@ -607,20 +940,20 @@ class LauncherApp(tk.Tk):
         )
 
         row += 1
-        ttk.Label(left, text="Loader Version (Optional)", style="FieldLabel.TLabel").grid(
+        _field_label(left, text="Loader Version (Optional)").grid(
             row=row, column=0, sticky="w", pady=(section_gap, 6)
         )
-        ttk.Label(left, text="Build (Optional)", style="FieldLabel.TLabel").grid(
+        _field_label(left, text="Build (Optional)").grid(
             row=row, column=1, sticky="w", padx=(col_gap, 0), pady=(section_gap, 6)
         )
         row += 1
         self.loader_version_combo = ttk.Combobox(
             left,
-            textvariable=self.loader_version_var,
+            textvariable=self.vars.loader_version,
             style="Input.TCombobox",
         )
         self.loader_version_combo.grid(row=row, column=0, sticky="ew")
-        self.build_entry = ttk.Entry(left, textvariable=self.build_var, style="Input.TEntry")
+        self.build_entry = ttk.Entry(left, textvariable=self.vars.build, style="Input.TEntry")
         self.build_entry.grid(row=row, column=1, sticky="ew", padx=(col_gap, 0))
 
         row += 1
@@ -628,7 +961,7 @@ class LauncherApp(tk.Tk):
             left,
             text="Refresh Loader Versions",
             style="Secondary.TButton",
-            command=self._refresh_loader_versions,
+            command=partial(self._refresh_loader_versions, force=True),
         )
         self.refresh_loader_versions_btn.grid(
             row=row,
@@ -639,11 +972,11 @@ class LauncherApp(tk.Tk):
         )
 
         row += 1
-        ttk.Label(left, text="Java Path", style="FieldLabel.TLabel").grid(
+        _field_label(left, text="Java Path").grid(
             row=row, column=0, columnspan=2, sticky="w", pady=(section_gap, 6)
         )
         row += 1
-        self.java_path_entry = ttk.Entry(left, textvariable=self.java_path_var, style="Input.TEntry")
+        self.java_path_entry = ttk.Entry(left, textvariable=self.vars.java_path, style="Input.TEntry")
         self.java_path_entry.grid(row=row, column=0, columnspan=2, sticky="ew")
 
         row += 1
@@ -651,18 +984,18 @@ class LauncherApp(tk.Tk):
         memory.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(section_gap, 0))
         memory.columnconfigure(1, weight=1)
         memory.columnconfigure(3, weight=1)
-        ttk.Label(memory, text="Xms", style="FieldLabel.TLabel").grid(row=0, column=0, sticky="w")
-        self.xms_entry = ttk.Entry(memory, textvariable=self.xms_var, style="Input.TEntry", width=12)
+        _field_label(memory, text="Xms").grid(row=0, column=0, sticky="w")
+        self.xms_entry = ttk.Entry(memory, textvariable=self.vars.xms, style="Input.TEntry", width=12)
         self.xms_entry.grid(row=0, column=1, sticky="ew", padx=(8, 20))
-        ttk.Label(memory, text="Xmx", style="FieldLabel.TLabel").grid(row=0, column=2, sticky="w")
-        self.xmx_entry = ttk.Entry(memory, textvariable=self.xmx_var, style="Input.TEntry", width=12)
+        _field_label(memory, text="Xmx").grid(row=0, column=2, sticky="w")
+        self.xmx_entry = ttk.Entry(memory, textvariable=self.vars.xmx, style="Input.TEntry", width=12)
         self.xmx_entry.grid(row=0, column=3, sticky="ew", padx=(8, 0))
 
         row += 1
         self.accept_eula_checkbox = ttk.Checkbutton(
             left,
             text="Accept EULA",
-            variable=self.accept_eula_var,
+            variable=self.vars.accept_eula,
         )
         self.accept_eula_checkbox.grid(
             row=row,
@@ -713,11 +1046,10 @@ class LauncherApp(tk.Tk):
         status_card = ttk.Frame(body, style="Card.TFrame", padding=card_padding)
         status_card.grid(row=0, column=1, sticky="ew")
         status_card.columnconfigure(0, weight=1)
-        ttk.Label(status_card, text="Status", style="CardTitle.TLabel").grid(row=0, column=0, sticky="w")
-        ttk.Label(
+        _card_title(status_card, text="Status").grid(row=0, column=0, sticky="w")
+        _card_subtitle(
             status_card,
             text="Install and runtime state for the selected server.",
-            style="CardSub.TLabel",
         ).grid(row=1, column=0, sticky="w", pady=(6, section_gap))
 
         status_grid = ttk.Frame(status_card, style="Card.TFrame")
@@ -726,13 +1058,13 @@ class LauncherApp(tk.Tk):
         ttk.Label(status_grid, text="Status", style="StatusKey.TLabel").grid(
             row=0, column=0, sticky="w", padx=(0, col_gap)
         )
-        ttk.Label(status_grid, textvariable=self.status_var, style="StatusValue.TLabel").grid(
+        ttk.Label(status_grid, textvariable=self.vars.status, style="StatusValue.TLabel").grid(
             row=0, column=1, sticky="w"
         )
         ttk.Label(status_grid, text="Address", style="StatusKey.TLabel").grid(
             row=1, column=0, sticky="w", padx=(0, col_gap), pady=(8, 0)
         )
-        ttk.Label(status_grid, textvariable=self.server_endpoint_var, style="StatusValue.TLabel").grid(
+        ttk.Label(status_grid, textvariable=self.vars.server_endpoint, style="StatusValue.TLabel").grid(
             row=1, column=1, sticky="w", pady=(8, 0)
         )
 
@@ -751,7 +1083,7 @@ class LauncherApp(tk.Tk):
         console_header = ttk.Frame(console_card, style="Card.TFrame")
         console_header.grid(row=0, column=0, sticky="ew")
         console_header.columnconfigure(0, weight=1)
-        ttk.Label(console_header, text="Server Console", style="CardTitle.TLabel").grid(
+        _card_title(console_header, text="Server Console").grid(
             row=0, column=0, sticky="w"
         )
         state_wrap = ttk.Frame(console_header, style="Card.TFrame")
@@ -768,13 +1100,12 @@ class LauncherApp(tk.Tk):
         self.console_state_dot_item = self.console_state_dot.create_oval(
             1, 1, 9, 9, fill=self._colors["state_offline"], outline=""
         )
-        ttk.Label(state_wrap, textvariable=self.console_state_var, style="ConsoleState.TLabel").grid(
+        ttk.Label(state_wrap, textvariable=self.vars.console_state, style="ConsoleState.TLabel").grid(
             row=0, column=1, sticky="e"
         )
-        ttk.Label(
+        _card_subtitle(
             console_card,
             text="Live output stream and command input while the server is online.",
-            style="CardSub.TLabel",
         ).grid(row=1, column=0, sticky="w", pady=(6, section_gap))
 
         self.log_area = ScrolledText(
@@ -784,21 +1115,27 @@ class LauncherApp(tk.Tk):
             bg=self._colors["console_bg"],
             fg=self._colors["text_primary"],
             insertbackground=self._colors["text_primary"],
+            # Read-only log: hide the edit caret a DISABLED Text would hide.
+            insertwidth=0,
             relief=tk.FLAT,
             padx=10,
             pady=10,
             borderwidth=0,
-            font=(self._mono_font, 10),
+            font="KSL.Mono",
         )
         self.log_area.grid(row=2, column=0, sticky="nsew")
-        self.log_area.configure(state=tk.DISABLED)
+        # The console stays in NORMAL state so appends need no state toggles;
+        # editing input is swallowed here instead.
+        self.log_area.bind("<Key>", self._on_log_key)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.log_area.bind(sequence, lambda _event: "break")
 
         command_row = ttk.Frame(console_card, style="Card.TFrame")
         command_row.grid(row=3, column=0, sticky="ew", pady=(section_gap, 0))
         command_row.columnconfigure(0, weight=1)
         self.console_entry = ttk.Entry(
             command_row,
-            textvariable=self.console_command_var,
+            textvariable=self.vars.console_command,
             style="Input.TEntry",
         )
         self.console_entry.grid(row=0, column=0, sticky="ew", padx=(0, col_gap))
@@ -818,7 +1155,7 @@ class LauncherApp(tk.Tk):
         self.console_entry.bind("<Return>", self._send_console_command)
         self.console_entry.bind("<FocusIn>", self._on_console_focus_in)
         self.console_entry.bind("<FocusOut>", self._on_console_focus_out)
-        self.instance_dir_var.trace_add("write", self._on_instance_dir_changed)
+        self.vars.instance_dir.trace_add("write", self._on_instance_dir_changed)
         self._bind_mousewheel_recursive(self._viewport_container)
 
     def _bind_mousewheel_recursive(self, widget: tk.Misc) -> None:
@@ -886,23 +1223,37 @@ class LauncherApp(tk.Tk):
         return "break"
 
     def _apply_command_placeholder(self) -> None:
-        if self.console_command_var.get().strip():
+        # The flag already says what the entry holds; skip the Tcl read then.
+        if self._command_placeholder_active or self.vars.console_command.get().strip():
             return
+        self._show_command_placeholder()
+
+    def _show_command_placeholder(self) -> None:
         self._command_placeholder_active = True
-        self.console_command_var.set(self._command_placeholder)
-        self.console_entry.configure(style="Placeholder.TEntry")
+        self.vars.console_command.set(self._command_placeholder)
+        self._set_console_style("Placeholder.TEntry")
 
     def _on_console_focus_in(self, _event: object = None) -> None:
         if self._command_placeholder_active:
-            self.console_command_var.set("")
+            self.vars.console_command.set("")
             self._command_placeholder_active = False
-            self.console_entry.configure(style="Input.TEntry")
+            self._set_console_style("Input.TEntry")
 
     def _on_console_focus_out(self, _event: object = None) -> None:
-        if not self.console_command_var.get().strip():
-            self._apply_command_placeholder()
+        self._apply_command_placeholder()
 
     def _on_instance_dir_changed(self, *_args: object) -> None:
+        if self._endpoint_refresh_id is not None:
+            self.after_cancel(self._endpoint_refresh_id)
+        self._endpoint_refresh_id = self.after(
+            ENDPOINT_REFRESH_DELAY_MS,
+            self._refresh_endpoint_if_changed,
+        )
+
+    def _refresh_endpoint_if_changed(self) -> None:
+        self._endpoint_refresh_id = None
+        if self.vars.instance_dir.get().strip() == self._last_refreshed_dir:
+            return
         self._refresh_server_endpoint()
 
     def _open_discord(self) -> None:
@@ -912,11 +1263,11 @@ class LauncherApp(tk.Tk):
         self._open_url(WEBSITE_URL)
 
     def _open_url(self, url: str) -> None:
-        parsed = urllib.parse.urlparse(url)
-        host = (parsed.hostname or "").lower()
-        if parsed.scheme.lower() != "https" or host not in ALLOWED_EXTERNAL_HOSTS:
+        if url not in SAFE_EXTERNAL_URLS:
             self._set_status("Blocked unsafe external link.")
             return
+        import webbrowser
+
         webbrowser.open_new_tab(url)
 
     def _show_about(self) -> None:
@@ -927,35 +1278,37 @@ class LauncherApp(tk.Tk):
         )
 
     def _on_loader_changed(self, _event: object = None) -> None:
-        self.loader_version_var.set("")
-        self.build_var.set("")
+        self.vars.loader_version.set("")
+        self.vars.build.set("")
         self._sync_optional_fields()
         self._refresh_versions()
 
     def _on_minecraft_version_changed(self, _event: object = None) -> None:
+        # Stepping through the combobox fires one event per item; only the
+        # version the user settles on is worth a catalog request.
+        if self._loader_refresh_id is not None:
+            self.after_cancel(self._loader_refresh_id)
+        self._loader_refresh_id = self.after(
+            LOADER_VERSION_REFRESH_DELAY_MS,
+            self._run_debounced_loader_refresh,
+        )
+
+    def _run_debounced_loader_refresh(self) -> None:
+        self._loader_refresh_id = None
         self._refresh_loader_versions()
 
     def _sync_optional_fields(self) -> None:
         if self._controls_busy:
-            self.loader_version_combo.configure(state="disabled")
-            self.refresh_loader_versions_btn.configure(state="disabled")
-            self.build_entry.configure(state="disabled")
-            return
-
-        loader = self.loader_var.get()
-        loader_version_supported = loader in {"fabric", "quilt", "forge", "neoforge"}
-        build_supported = loader in {"paper", "folia", "purpur"}
-
-        self.loader_version_combo.configure(
-            state="normal" if loader_version_supported else "disabled"
-        )
-        self.refresh_loader_versions_btn.configure(
-            state="normal" if loader_version_supported else "disabled"
-        )
-        self.build_entry.configure(state="normal" if build_supported else "disabled")
+            states = _OPTIONAL_FIELDS_DISABLED
+        else:
+            states = _LOADER_WIDGET_STATE.get(self.vars.loader.get(), _OPTIONAL_FIELDS_DISABLED)
+        loader_version_state, refresh_state, build_state = states
+        self._set_state(self.loader_version_combo, loader_version_state)
+        self._set_state(self.refresh_loader_versions_btn, refresh_state)
+        self._set_state(self.build_entry, build_state)
 
     def _browse_instance_dir(self) -> None:
-        initial_dir = self.instance_dir_var.get().strip()
+        initial_dir = self.vars.instance_dir.get().strip()
         if not initial_dir:
             initial_dir = str((Path.cwd() / "servers").resolve())
         selected = filedialog.askdirectory(
@@ -963,7 +1316,7 @@ class LauncherApp(tk.Tk):
             initialdir=initial_dir,
         )
         if selected:
-            self.instance_dir_var.set(selected)
+            self.vars.instance_dir.set(selected)
             self._storage_selected = True
             self._save_settings()
             self._refresh_server_endpoint()
@@ -975,13 +1328,13 @@ class LauncherApp(tk.Tk):
         chosen = self._choose_storage_folder()
         if not chosen:
             fallback = str((Path.cwd() / "servers" / "my-server").resolve())
-            self.instance_dir_var.set(fallback)
+            self.vars.instance_dir.set(fallback)
             self._enqueue_log(
                 f"No storage folder selected. Using temporary default: {fallback}"
             )
 
     def _ensure_storage_before_action(self) -> bool:
-        current = self.instance_dir_var.get().strip()
+        current = self.vars.instance_dir.get().strip()
         if current:
             return True
         return self._choose_storage_folder()
@@ -993,7 +1346,7 @@ class LauncherApp(tk.Tk):
         )
         if not selected:
             return False
-        self.instance_dir_var.set(selected)
+        self.vars.instance_dir.set(selected)
         self._storage_selected = True
         self._save_settings()
         self._enqueue_log(f"Server storage folder set to: {selected}")
@@ -1004,7 +1357,7 @@ class LauncherApp(tk.Tk):
         if not self._ensure_storage_before_action():
             self._set_status("Choose a folder first.")
             return
-        path = Path(self.instance_dir_var.get()).resolve()
+        path = Path(self.vars.instance_dir.get()).resolve()
         path.mkdir(parents=True, exist_ok=True)
         try:
             self._launch_folder(str(path))
@@ -1013,43 +1366,112 @@ class LauncherApp(tk.Tk):
             self._set_status(f"Could not open folder: {exc}")
 
     def _clear_log(self) -> None:
-        self.log_area.configure(state=tk.NORMAL)
         self.log_area.delete("1.0", tk.END)
-        self.log_area.configure(state=tk.DISABLED)
+        self._log_line_count = 0
 
-    def _refresh_versions(self) -> None:
-        loader = self.loader_var.get()
-        self._run_background_task(
-            "refresh_versions",
-            lambda: self.catalog.list_minecraft_versions(loader=loader),
-        )
+    def _refresh_versions(self, force: bool = False) -> None:
+        # force (the Refresh button) skips every cache layer and hits the network.
+        loader = self.vars.loader.get()
+        if force:
+            self.catalog.clear_cache()
+        else:
+            recent = self._recent_version_list(("minecraft", loader))
+            if recent is not None:
+                self._apply_minecraft_versions(loader, recent)
+                return
+        cached = None if force else self._read_version_cache(loader)
+        if cached is None:
+            self._run_background_task(
+                "refresh_versions",
+                lambda: (loader, self._fetch_minecraft_versions(loader)),
+            )
+            return
+        # Show the cached list right away and revalidate it quietly.
+        self._apply_minecraft_versions(loader, cached)
+        future = self._task_pool.submit(self._fetch_minecraft_versions, loader)
+        future.add_done_callback(partial(self._on_versions_revalidated, loader))
+
+    def _recent_version_list(self, key: tuple[str, ...]) -> list[str] | None:
+        entry = self._version_lists.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _remember_version_list(self, key: tuple[str, ...], versions: list[str]) -> None:
+        # Called from pool threads; a single dict store is atomic under the GIL.
+        self._version_lists[key] = (time.monotonic() + VERSION_LIST_TTL_SECONDS, versions)
+
+    def _version_cache_path(self, loader: str) -> Path:
+        return self._settings_path.parent / VERSION_CACHE_DIRNAME / f"{loader}.json"
+
+    def _read_version_cache(self, loader: str) -> list[str] | None:
+        path = self._version_cache_path(loader)
+        try:
+            if time.time() - path.stat().st_mtime > VERSION_CACHE_TTL_SECONDS:
+                return None
+            payload = loads_json(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, list):
+            return None
+        return [str(version) for version in payload]
+
+    def _fetch_minecraft_versions(self, loader: str) -> list[str]:
+        versions = self.catalog.list_minecraft_versions(loader=loader)
+        self._remember_version_list(("minecraft", loader), versions)
+        path = self._version_cache_path(loader)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(dumps_json(versions))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+        return versions
 
-    def _refresh_loader_versions(self) -> None:
-        loader = self.loader_var.get()
-        mc_version = (self.mc_version_var.get() or "latest").strip()
+    def _on_versions_revalidated(self, loader: str, future: Future[list[str]]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._post_ui("versions_revalidated", (loader, future.result()))
+
+    def _refresh_loader_versions(self, force: bool = False) -> None:
+        loader = self.vars.loader.get()
+        mc_version = (self.vars.mc_version.get() or "latest").strip()
         if mc_version.lower() == "latest":
-            self.loader_version_combo["values"] = []
+            self._set_combo_values(self.loader_version_combo, [])
             return
+        if force:
+            self.catalog.clear_cache()
+        else:
+            recent = self._recent_version_list(("loader", loader, mc_version))
+            if recent is not None:
+                self._on_refresh_loader_versions(recent)
+                return
         self._run_background_task(
             "refresh_loader_versions",
-            lambda: self.catalog.list_loader_versions(
-                loader=loader,
-                minecraft_version=mc_version,
-            ),
+            lambda: self._fetch_loader_versions(loader, mc_version),
         )
 
+    def _fetch_loader_versions(self, loader: str, mc_version: str) -> list[str]:
+        versions = self.catalog.list_loader_versions(
+            loader=loader,
+            minecraft_version=mc_version,
+        )
+        self._remember_version_list(("loader", loader, mc_version), versions)
+        return versions
+
     def _install(self) -> None:
         if not self._ensure_storage_before_action():
             self._set_status("Install cancelled: choose a storage folder first.")
             return
 
-        loader = self.loader_var.get().strip()
-        minecraft_version = (self.mc_version_var.get() or "latest").strip()
-        loader_version = self.loader_version_var.get().strip() or None
-        build = self.build_var.get().strip() or None
-        instance_dir = Path(self.instance_dir_var.get().strip()).resolve()
-        java_path = self.java_path_var.get().strip() or "java"
-        accept_eula = bool(self.accept_eula_var.get())
+        loader = self.vars.loader.get().strip()
+        minecraft_version = (self.vars.mc_version.get() or "latest").strip()
+        loader_version = self.vars.loader_version.get().strip() or None
+        build = self.vars.build.get().strip() or None
+        instance_dir = Path(self.vars.instance_dir.get().strip()).resolve()
+        java_path = self.vars.java_path.get().strip() or "java"
+        accept_eula = bool(self.vars.accept_eula.get())
 
         request = InstallRequest(
             loader=loader,
@@ -1071,10 +1493,10 @@ class LauncherApp(tk.Tk):
             self._set_status("Server is already running.")
             return
 
-        instance_dir = Path(self.instance_dir_var.get().strip()).resolve()
-        java_path = self.java_path_var.get().strip() or "java"
-        xms = self.xms_var.get().strip() or None
-        xmx = self.xmx_var.get().strip() or None
+        instance_dir = Path(self.vars.instance_dir.get().strip()).resolve()
+        java_path = self.vars.java_path.get().strip() or "java"
+        xms = self.vars.xms.get().strip() or None
+        xmx = self.vars.xmx.get().strip() or None
 
         def _start_server() -> ServerProcess:
             return self.manager.start(
@@ -1099,19 +1521,18 @@ class LauncherApp(tk.Tk):
         entry_state = "normal" if enabled else "disabled"
         combo_state = "readonly" if enabled else "disabled"
 
-        self.instance_dir_entry.configure(state=entry_state)
-        self.java_path_entry.configure(state=entry_state)
-        self.xms_entry.configure(state=entry_state)
-        self.xmx_entry.configure(state=entry_state)
-        self.build_entry.configure(state=entry_state)
-        self.loader_combo.configure(state=combo_state)
-        self.mc_version_combo.configure(state=combo_state)
-        self.browse_folder_btn.configure(state=entry_state)
-        self.refresh_versions_btn.configure(state=entry_state)
-        self.accept_eula_checkbox.configure(state=entry_state)
-        self.open_folder_btn.configure(state=entry_state)
-        self.discord_btn.configure(state=entry_state)
-        self.website_btn.configure(state=entry_state)
+        self._set_state(self.instance_dir_entry, entry_state)
+        self._set_state(self.java_path_entry, entry_state)
+        self._set_state(self.xms_entry, entry_state)
+        self._set_state(self.xmx_entry, entry_state)
+        self._set_state(self.loader_combo, combo_state)
+        self._set_state(self.mc_version_combo, combo_state)
+        self._set_state(self.browse_folder_btn, entry_state)
+        self._set_state(self.refresh_versions_btn, entry_state)
+        self._set_state(self.accept_eula_checkbox, entry_state)
+        self._set_state(self.open_folder_btn, entry_state)
+        self._set_state(self.discord_btn, entry_state)
+        self._set_state(self.website_btn, entry_state)
 
         self._sync_optional_fields()
         self._update_runtime_controls()
@@ -1119,170 +1540,279 @@ class LauncherApp(tk.Tk):
 
     def _update_runtime_controls(self) -> None:
         process_running = bool(self._server_process and self._server_process.is_running())
-        self.start_btn.configure(
-            state="disabled" if self._controls_busy or process_running else "normal"
-        )
-        self.install_btn.configure(
-            state="disabled" if self._controls_busy or process_running else "normal"
-        )
-        self.stop_btn.configure(
-            state="normal" if process_running and not self._controls_busy else "disabled"
+        launch_state = "disabled" if self._controls_busy or process_running else "normal"
+        self._set_state(self.start_btn, launch_state)
+        self._set_state(self.install_btn, launch_state)
+        self._set_state(
+            self.stop_btn,
+            "normal" if process_running and not self._controls_busy else "disabled",
         )
 
     def _update_console_controls(self) -> None:
         process_running = bool(self._server_process and self._server_process.is_running())
         console_state = "normal" if process_running and not self._controls_busy else "disabled"
         self._update_console_state_indicator(process_running)
-        self.console_entry.configure(state=console_state)
-        self.send_command_btn.configure(state=console_state)
+        self._set_state(self.console_entry, console_state)
+        self._set_state(self.send_command_btn, console_state)
         if console_state == "normal":
             if self._command_placeholder_active:
-                self.console_entry.configure(style="Placeholder.TEntry")
+                self._set_console_style("Placeholder.TEntry")
             else:
-                self.console_entry.configure(style="Input.TEntry")
-                if not self.console_command_var.get().strip():
-                    self._apply_command_placeholder()
+                self._set_console_style("Input.TEntry")
+                self._apply_command_placeholder()
         else:
-            self.console_entry.configure(style="Input.TEntry")
+            self._set_console_style("Input.TEntry")
+
+    def _set_console_style(self, style: str) -> None:
+        if style == self._console_style:
+            return
+        self._console_style = style
+        self.console_entry.configure(style=style)
 
     def _update_console_state_indicator(self, running: bool) -> None:
-        if not hasattr(self, "console_state_dot"):
+        if running is self._indicator_running or not hasattr(self, "console_state_dot"):
             return
+        self._indicator_running = running
         color = self._colors["state_online"] if running else self._colors["state_offline"]
         text = "Online" if running else "Offline"
         self.console_state_dot.itemconfigure(self.console_state_dot_item, fill=color)
-        self.console_state_var.set(text)
+        self.vars.console_state.set(text)
 
     def _run_background_task(self, task_name: str, fn) -> None:
-        if self._worker and self._worker.is_alive():
+        if task_name in self._inflight or (
+            self._inflight and not _CONCURRENT_TASKS.issuperset((task_name, *self._inflight))
+        ):
             self._set_status("Another task is already running.")
             return
 
-        def _runner() -> None:
-            try:
-                result = fn()
-                self._ui_queue.put(("task_done", (task_name, result)))
-            except Exception as exc:
-                details = "".join(traceback.format_exception(exc))
-                self._ui_queue.put(("task_error", (task_name, str(exc), details)))
-
-        worker = threading.Thread(target=_runner, daemon=True)
-        worker.start()
-        self._worker = worker
-        self._set_controls_enabled(False)
-        self.progress.start(10)
+        future = self._task_pool.submit(fn)
+        self._inflight[task_name] = future
+        future.add_done_callback(partial(self._on_future_done, task_name))
+        if not self._controls_busy:
+            self._set_controls_enabled(False)
+        if self._progress_start_id is None and not self._progress_running:
+            self._progress_start_id = self.after(PROGRESS_START_DELAY_MS, self._start_progress)
         self._set_status(f"Running: {task_name}")
 
+    def _release_controls_if_idle(self) -> None:
+        if not self._inflight:
+            self._stop_progress()
+            self._set_controls_enabled(True)
+
+    def _on_future_done(self, task_name: str, future: Future[object]) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None:
+            self._post_ui("task_done", (task_name, future.result()))
+            return
+        details = "".join(traceback.format_exception(exc))
+        self._post_ui("task_error", (task_name, str(exc), details))
+
+    def _post_ui(self, event: str, payload: object) -> None:
+        self._ui_queue.append((event, payload))
+        # One <<UiQueue>> per burst: event_generate from a worker thread waits
+        # for the Tk thread, so the log reader must not pay that per line.
+        if self._destroyed or self._ui_wakeup_pending:
+            return
+        self._ui_wakeup_pending = True
+        try:
+            self.event_generate(UI_QUEUE_EVENT, when="tail")
+        except (RuntimeError, tk.TclError):
+            # Tk is not in its main loop yet (or is shutting down); the
+            # safety-net poll picks the message up.
+            pass
+
     def _poll_ui_queue(self) -> None:
-        while True:
+        if self._destroyed:
+            return
+        if self._ui_queue:
+            self._drain_ui_queue()
+        self.after(UI_QUEUE_SAFETY_INTERVAL_MS, self._poll_ui_queue)
+
+    def _drain_ui_queue(self) -> None:
+        if self._destroyed:
+            return
+        # Cleared before popping, so anything appended from here on either
+        # lands in this batch or posts a fresh wakeup.
+        self._ui_wakeup_pending = False
+        pending_logs: list[str] = []
+        for _ in range(UI_QUEUE_BATCH_LIMIT):
+            # A nested event loop (e.g. a dialog) can re-enter this method and
+            # empty the deque underneath us, so never trust a snapshot length.
             try:
-                event, payload = self._ui_queue.get_nowait()
-            except queue.Empty:
+                event, payload = self._ui_queue.popleft()
+            except IndexError:
                 break
 
             if event == "log":
-                self._append_log(str(payload))
+                pending_logs.append(str(payload))
                 continue
 
+            if pending_logs:
+                self._append_log_lines(pending_logs)
+                pending_logs = []
+
             if event == "task_done":
                 task_name, result = payload  # type: ignore[misc]
                 self._handle_task_done(str(task_name), result)
                 continue
 
+            if event == "brand_assets":
+                logo_path, icon_path = payload  # type: ignore[misc]
+                self._load_brand_assets(logo_path, icon_path)
+                continue
+
+            if event == "versions_revalidated":
+                loader, versions = payload  # type: ignore[misc]
+                if loader == self.vars.loader.get():
+                    self._apply_minecraft_versions(loader, versions)
+                continue
+
+            if event == "lan_ip":
+                self._handle_lan_ip(payload)  # type: ignore[arg-type]
+                continue
+
+            if event == "process_exited":
+                process, code = payload  # type: ignore[misc]
+                self._handle_process_exit(process, code)
+                continue
+
             if event == "task_error":
                 task_name, short_error, full_error = payload  # type: ignore[misc]
                 self._append_log(full_error)
                 self._set_status(f"{task_name} failed: {short_error}")
-                messagebox.showerror("Task Failed", f"{task_name} failed:\n{short_error}")
-                self.progress.stop()
-                self._set_controls_enabled(True)
+                self._inflight.pop(str(task_name), None)
+                self._release_controls_if_idle()
+                # The dialog runs a nested event loop; open it after this batch.
+                self.after_idle(
+                    partial(
+                        messagebox.showerror,
+                        "Task Failed",
+                        f"{task_name} failed:\n{short_error}",
+                    )
+                )
 
-        self.after(100, self._poll_ui_queue)
+        if pending_logs:
+            self._append_log_lines(pending_logs)
+        if self._ui_queue:
+            self.after_idle(self._drain_ui_queue)
 
     def _handle_task_done(self, task_name: str, result: object) -> None:
-        if task_name == "refresh_versions":
-            versions = ["latest"] + [str(v) for v in result]  # type: ignore[arg-type]
-            self.mc_version_combo["values"] = versions
-            if self.mc_version_var.get() not in versions:
-                self.mc_version_var.set("latest")
-            self._set_status("Version list refreshed.")
+        # Drop the task first so a handler may chain a follow-up lookup.
+        self._inflight.pop(task_name, None)
+        handler = self._task_handlers.get(task_name)
+        if handler is not None:
+            handler(result)
+        self._release_controls_if_idle()
+
+    def _start_progress(self) -> None:
+        self._progress_start_id = None
+        self._progress_running = True
+        self.progress.start(PROGRESS_INTERVAL_MS)
+
+    def _stop_progress(self) -> None:
+        if self._progress_start_id is not None:
+            self.after_cancel(self._progress_start_id)
+            self._progress_start_id = None
+        if self._progress_running:
+            self._progress_running = False
             self.progress.stop()
-            self._set_controls_enabled(True)
-            return
 
-        if task_name == "refresh_loader_versions":
-            versions = [str(v) for v in result]  # type: ignore[arg-type]
-            self.loader_version_combo["values"] = versions
-            self._set_status("Loader version list refreshed.")
-            self.progress.stop()
-            self._set_controls_enabled(True)
-            return
+    def _on_refresh_versions(self, result: object) -> None:
+        loader, versions = result  # type: ignore[misc]
+        self._apply_minecraft_versions(loader, [str(v) for v in versions])
+        self._set_status("Version list refreshed.")
+
+    def _apply_minecraft_versions(self, loader: str, minecraft_versions: list[str]) -> None:
+        versions = ["latest"] + minecraft_versions
+        self._set_combo_values(self.mc_version_combo, versions)
+        if self.vars.mc_version.get() not in versions:
+            self.vars.mc_version.set("latest")
+        self._prefetch_loader_versions(loader, minecraft_versions)
+
+    def _on_refresh_loader_versions(self, result: object) -> None:
+        versions = [str(v) for v in result]  # type: ignore[attr-defined]
+        self._set_combo_values(self.loader_version_combo, versions)
+        self._set_status("Loader version list refreshed.")
+
+    def _on_install(self, result: object) -> None:
+        if isinstance(result, InstallResult):
+            self._append_log(
+                "Installed "
+                f"{result.manifest.loader} "
+                f"{result.manifest.minecraft_version} "
+                f"at {result.instance_dir}"
+            )
+        self._set_status("Install completed.")
+        self._endpoint_cache.clear()
+        self._refresh_server_endpoint()
 
-        if task_name == "install":
-            install_result = result  # type: ignore[assignment]
-            if isinstance(install_result, InstallResult):
-                self._append_log(
-                    "Installed "
-                    f"{install_result.manifest.loader} "
-                    f"{install_result.manifest.minecraft_version} "
-                    f"at {install_result.instance_dir}"
-                )
-            self._set_status("Install completed.")
-            self._refresh_server_endpoint()
-            self.progress.stop()
-            self._set_controls_enabled(True)
+    def _on_start(self, result: object) -> None:
+        if not isinstance(result, ServerProcess):
             return
+        process = result
+        self._server_process = process
+        process.add_exit_callback(
+            lambda code: self._post_ui("process_exited", (process, code))
+        )
+        self._append_log(f"Server started (PID {process.pid}).")
+        self._set_status("Server running.")
+        self._update_console_controls()
 
-        if task_name == "start":
-            process = result  # type: ignore[assignment]
-            if isinstance(process, ServerProcess):
-                self._server_process = process
-                self._append_log(f"Server started (PID {process.pid}).")
-                self._set_status("Server running.")
-                self._update_console_controls()
-            self.progress.stop()
-            self._set_controls_enabled(True)
-            return
+    def _on_stop(self, result: object) -> None:
+        exit_code = int(result)  # type: ignore[call-overload]
+        self._append_log(f"Server stopped with exit code {exit_code}.")
+        self._server_process = None
+        self._set_status("Server stopped.")
+        self._update_console_controls()
 
-        if task_name == "stop":
-            exit_code = int(result)
-            self._append_log(f"Server stopped with exit code {exit_code}.")
-            self._server_process = None
-            self._set_status("Server stopped.")
-            self._update_console_controls()
-            self.progress.stop()
-            self._set_controls_enabled(True)
+    def _prefetch_loader_versions(self, loader: str, minecraft_versions: list[str]) -> None:
+        """Warm loader-version lists for the newest few Minecraft versions."""
+        if loader not in _PREFETCH_LOADERS:
             return
+        for mc_version in minecraft_versions[:PREFETCH_VERSION_COUNT]:
+            key = (loader, mc_version)
+            if key in self._prefetching:
+                continue
+            if self._recent_version_list(("loader", *key)) is not None:
+                continue
+            self._prefetching.add(key)
+            future = self._prefetch_pool.submit(self._fetch_loader_versions, loader, mc_version)
+            # Failures are ignored; selecting the version later fetches again.
+            future.add_done_callback(lambda _future, key=key: self._prefetching.discard(key))
 
     def _launch_folder(self, path: str) -> None:
-        import os
-        import subprocess
-        import sys
-
         if os.name == "nt":
             os.startfile(path)  # type: ignore[attr-defined]
             return
-        if sys.platform == "darwin":
-            subprocess.Popen(["open", path])
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        subprocess.Popen(
+            [opener, path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+
+    def _handle_process_exit(self, process: ServerProcess, code: int) -> None:
+        if process is not self._server_process:
             return
-        subprocess.Popen(["xdg-open", path])
-
-    def _poll_process_state(self) -> None:
-        if self._server_process and not self._server_process.is_running():
-            code = self._server_process.poll()
-            self._append_log(f"Server exited with code {code}.")
-            self._set_status("Server not running.")
-            self._server_process = None
-            self._update_runtime_controls()
-            self._update_console_controls()
-        self.after(1000, self._poll_process_state)
+        self._append_log(f"Server exited with code {code}.")
+        self._set_status("Server not running.")
+        self._server_process = None
+        self._update_runtime_controls()
+        self._update_console_controls()
 
     def _enqueue_log(self, line: str) -> None:
-        self._ui_queue.put(("log", line))
+        self._post_ui("log", line)
 
     def _send_console_command(self, _event: object = None) -> None:
-        command = self.console_command_var.get().strip()
-        if not command or self._command_placeholder_active:
+        if self._command_placeholder_active:
+            return
+        command = self.vars.console_command.get().strip()
+        if not command:
             return
         process = self._server_process
         if not process or not process.is_running():
@@ -1291,88 +1821,222 @@ class LauncherApp(tk.Tk):
             return
         process.send_command(command)
         self._append_log(f"> {command}")
-        self.console_command_var.set("")
-        self._command_placeholder_active = False
-        self._apply_command_placeholder()
+        self._show_command_placeholder()
 
     def _append_log(self, line: str) -> None:
-        self.log_area.configure(state=tk.NORMAL)
-        self.log_area.insert(tk.END, line.rstrip() + "\n")
+        self._append_log_lines([line])
+
+    def _append_log_lines(self, lines: list[str]) -> None:
+        text = "".join(line.rstrip() + "\n" for line in lines)
+        self.log_area.insert(tk.END, text)
+        self._log_line_count += text.count("\n")
+        if self._log_line_count > LOG_MAX_LINES:
+            excess = self._log_line_count - LOG_TRIM_TO_LINES
+            self.log_area.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count -= excess
         self.log_area.see(tk.END)
-        self.log_area.configure(state=tk.DISABLED)
+
+    @staticmethod
+    def _on_log_key(event: tk.Event) -> str | None:
+        keysym = event.keysym
+        if keysym in _LOG_NAVIGATION_KEYS:
+            return None
+        if event.state & _COPY_MODIFIER_MASK and keysym in _LOG_COPY_KEYS:
+            return None
+        return "break"
 
     def _set_status(self, status: str) -> None:
-        self.status_var.set(status)
+        if status == self._last_status:
+            return
+        self._last_status = status
+        self.vars.status.set(status)
+
+    def _set_endpoint(self, endpoint: str) -> None:
+        if endpoint == self._last_endpoint:
+            return
+        self._last_endpoint = endpoint
+        self.vars.server_endpoint.set(endpoint)
+
+    def _set_state(self, widget: tk.Misc, state: str) -> None:
+        key = str(widget)
+        if self._widget_states.get(key) == state:
+            return
+        self._widget_states[key] = state
+        widget.configure(state=state)
+
+    def _set_combo_values(self, combo: ttk.Combobox, values: list[str]) -> None:
+        key = str(combo)
+        new_values = tuple(values)
+        if self._combo_values.get(key) == new_values:
+            return
+        self._combo_values[key] = new_values
+        combo["values"] = new_values
 
     def _refresh_server_endpoint(self) -> None:
-        instance_value = self.instance_dir_var.get().strip()
+        instance_value = self.vars.instance_dir.get().strip()
+        self._last_refreshed_dir = instance_value
         if not instance_value:
-            self.server_endpoint_var.set("Choose a folder")
+            self._set_endpoint("Choose a folder")
             return
 
-        instance_dir = Path(instance_value).resolve()
-        properties_path = instance_dir / "server.properties"
-        if not properties_path.exists():
-            self.server_endpoint_var.set("Pending (server.properties not found)")
+        # abspath is purely lexical; resolve() would stat every path component.
+        instance_dir = os.path.abspath(instance_value)
+        properties_path = os.path.join(instance_dir, "server.properties")
+        try:
+            stat = os.stat(properties_path)
+        except OSError:
+            self._set_endpoint("Pending (server.properties not found)")
             return
 
-        configured_host, port = read_server_endpoint(instance_dir)
+        cached = self._endpoint_cache.get(properties_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            configured_host, port = cached[2], cached[3]
+        else:
+            configured_host, port = read_server_endpoint(Path(instance_dir))
+            if cached is None and len(self._endpoint_cache) >= ENDPOINT_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest folder.
+                del self._endpoint_cache[next(iter(self._endpoint_cache))]
+            self._endpoint_cache[properties_path] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                configured_host,
+                port,
+            )
         if configured_host:
-            endpoint = self._format_host_port(configured_host, port)
-            self.server_endpoint_var.set(endpoint)
+            endpoint = _format_host_port(configured_host, port)
+            self._set_endpoint(endpoint)
             return
 
-        detected_host = self._detect_lan_ip() or "0.0.0.0"
-        endpoint = self._format_host_port(detected_host, port)
-        self.server_endpoint_var.set(f"{endpoint} (server-ip empty; using LAN/default)")
+        detected_host = self._cached_lan_ip() or "0.0.0.0"
+        endpoint = _format_host_port(detected_host, port)
+        self._set_endpoint(f"{endpoint} (server-ip empty; using LAN/default)")
+
+    def _cached_lan_ip(self) -> str | None:
+        """Return the last detected LAN address, refreshing it in the background."""
+        cached = self._lan_ip_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        if not self._lan_ip_pending:
+            try:
+                future = self._task_pool.submit(self._detect_lan_ip)
+            except RuntimeError:  # pool already shut down
+                return cached[1] if cached is not None else None
+            self._lan_ip_pending = True
+            future.add_done_callback(self._on_lan_ip_detected)
+        return cached[1] if cached is not None else None
+
+    def _on_lan_ip_detected(self, future: Future[str | None]) -> None:
+        # Always report back, even on failure, so _lan_ip_pending is reset.
+        address = None
+        if not future.cancelled() and future.exception() is None:
+            address = future.result()
+        self._post_ui("lan_ip", address)
+
+    def _handle_lan_ip(self, address: str | None) -> None:
+        self._lan_ip_pending = False
+        self._lan_ip_cache = (time.monotonic() + LAN_IP_CACHE_TTL_SECONDS, address)
+        self._refresh_server_endpoint()
 
     @staticmethod
     def _detect_lan_ip() -> str | None:
+        # Connecting a UDP socket only selects a route; no packet is sent.
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+                probe.setblocking(False)
                 probe.connect(("8.8.8.8", 80))
                 candidate = probe.getsockname()[0].strip()
-                if candidate and not candidate.startswith("127."):
-                    return candidate
-        except OSError:
-            pass
-        try:
-            fallback = socket.gethostbyname(socket.gethostname()).strip()
-            if fallback and not fallback.startswith("127."):
-                return fallback
         except OSError:
-            pass
+            return None
+        if candidate and not candidate.startswith("127."):
+            return candidate
         return None
 
-    @staticmethod
-    def _format_host_port(host: str, port: int) -> str:
-        if ":" in host and not host.startswith("["):
-            return f"[{host}]:{port}"
-        return f"{host}:{port}"
-
     def _load_saved_instance_dir(self) -> str:
         payload = self._load_settings()
         instance_dir = str(payload.get("instance_dir", "")).strip()
         return instance_dir
 
     def _load_settings(self) -> dict[str, str]:
-        if not self._settings_path.exists():
+        try:
+            mtime_ns = self._settings_path.stat().st_mtime_ns
+        except OSError:
             return {}
+        with self._settings_lock:
+            if self._last_saved_settings is not None and mtime_ns == self._settings_mtime_ns:
+                return dict(self._last_saved_settings)
         try:
-            with self._settings_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-            if isinstance(payload, dict):
-                return {str(k): str(v) for k, v in payload.items()}
-        except Exception:
+            payload = loads_json(self._settings_path.read_bytes())
+        except (OSError, ValueError):
             return {}
-        return {}
+        if not isinstance(payload, dict):
+            return {}
+        settings = {str(k): str(v) for k, v in payload.items()}
+        with self._settings_lock:
+            self._last_saved_settings = settings
+            self._settings_mtime_ns = mtime_ns
+        return dict(settings)
 
     def _save_settings(self) -> None:
-        self._settings_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"instance_dir": self.instance_dir_var.get().strip()}
-        with self._settings_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
-            handle.write("\n")
+        state = {"instance_dir": self.vars.instance_dir.get().strip()}
+        with self._settings_lock:
+            if self._settings_state is None and state == self._last_saved_settings:
+                return
+            self._settings_state = state
+        self._settings_dirty.set()
+        if self._settings_writer is None:
+            self._settings_writer = threading.Thread(
+                target=self._settings_writer_loop,
+                name="launcher-settings",
+                daemon=True,
+            )
+            self._settings_writer.start()
+            # Covers exits that never reach destroy(), e.g. an unhandled error.
+            atexit.register(self._flush_settings)
+
+    def _settings_writer_loop(self) -> None:
+        while True:
+            self._settings_dirty.wait()
+            time.sleep(SETTINGS_WRITE_DELAY_SECONDS)
+            self._settings_dirty.clear()
+            self._flush_settings()
+
+    def _flush_settings(self) -> None:
+        with self._settings_io_lock:
+            with self._settings_lock:
+                payload = self._settings_state
+                self._settings_state = None
+                if payload is None or payload == self._last_saved_settings:
+                    return
+            serialized = dumps_json(payload)
+            mtime_ns = self._settings_mtime_ns
+            try:
+                unchanged = self._settings_path.read_bytes() == serialized
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                try:
+                    self._settings_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = self._settings_path.with_suffix(".tmp")
+                    tmp_path.write_bytes(serialized)
+                    tmp_path.replace(self._settings_path)
+                    mtime_ns = self._settings_path.stat().st_mtime_ns
+                except OSError:
+                    return
+            with self._settings_lock:
+                self._last_saved_settings = payload
+                self._settings_mtime_ns = mtime_ns
+
+    def _on_close(self) -> None:
+        self.destroy()
+
+    def destroy(self) -> None:
+        if self._destroyed:
+            return
+        self._destroyed = True
+        self._flush_settings()
+        self._task_pool.shutdown()
+        self._prefetch_pool.shutdown()
+        super().destroy()
 
 
 def main() -> int:
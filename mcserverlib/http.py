@@ -1,21 +1,38 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterator
+import io
 import ipaddress
-import json
 import ssl
 import tempfile
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
 
 from .exceptions import DownloadError
-from .utils import hash_file
+from .utils import hash_file, loads_json
 
 
 MAX_TEXT_RESPONSE_BYTES = 16 * 1024 * 1024
 MAX_DOWNLOAD_BYTES = 512 * 1024 * 1024
+MAX_VALIDATOR_ENTRIES = 32
+
+_default_client: HttpClient | None = None
+_default_client_lock = threading.Lock()
+
+
+def default_http_client() -> HttpClient:
+    """Return the process-wide client shared by catalogs and managers."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HttpClient()
+    return _default_client
 
 
 class HttpClient:
@@ -30,42 +47,82 @@ class HttpClient:
         self.max_download_bytes = max_download_bytes
         self.user_agent = "mcserverlib/0.1 (+https://github.com/)"
         self._ssl_context = self._build_ssl_context()
+        # url -> (etag, last_modified, body) for conditional revalidation,
+        # least recently used first; bounded because bodies are kept whole.
+        self._validators: OrderedDict[str, tuple[str | None, str | None, bytes]] = (
+            OrderedDict()
+        )
+        self._validators_lock = threading.Lock()
 
-    def _request(self, url: str) -> urllib.request.Request:
+    def _request(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> urllib.request.Request:
         self._validate_url(url)
-        return urllib.request.Request(url, headers={"User-Agent": self.user_agent})
+        return urllib.request.Request(
+            url,
+            headers={"User-Agent": self.user_agent, **(headers or {})},
+        )
 
-    def _open(self, url: str):
-        request = self._request(url)
+    def _open(self, url: str, headers: dict[str, str] | None = None):
+        request = self._request(url, headers)
         return urllib.request.urlopen(
             request,
             timeout=self.timeout_seconds,
             context=self._ssl_context,
         )
 
-    def get_json(self, url: str) -> Any:
+    def _get_bytes(self, url: str) -> bytes:
+        with self._validators_lock:
+            cached = self._validators.get(url)
+            if cached is not None:
+                self._validators.move_to_end(url)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         try:
-            with self._open(url) as response:
-                payload = self._read_limited(
+            with self._open(url, headers) as response:
+                body = self._read_limited(
                     response,
                     max_bytes=self.max_text_response_bytes,
                     url=url,
-                ).decode("utf-8")
+                )
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304 and cached is not None:
+                exc.close()
+                return cached[2]
+            raise DownloadError(f"Request failed for {url}: {exc}") from exc
         except (urllib.error.URLError, ssl.SSLError) as exc:
             raise DownloadError(f"Request failed for {url}: {exc}") from exc
+        if etag or last_modified:
+            with self._validators_lock:
+                self._validators[url] = (etag, last_modified, body)
+                self._validators.move_to_end(url)
+                while len(self._validators) > MAX_VALIDATOR_ENTRIES:
+                    self._validators.popitem(last=False)
+        return body
+
+    def get_json(self, url: str) -> Any:
+        payload = self._get_bytes(url)
         try:
-            return json.loads(payload)
-        except json.JSONDecodeError as exc:
+            return loads_json(payload)
+        except ValueError as exc:
             raise DownloadError(f"Invalid JSON from {url}") from exc
 
     def get_text(self, url: str) -> str:
+        return self._get_bytes(url).decode("utf-8")
+
+    @contextmanager
+    def get_stream(self, url: str) -> Iterator[IO[bytes]]:
+        """Yield the response body as a size-limited binary stream."""
         try:
             with self._open(url) as response:
-                return self._read_limited(
-                    response,
-                    max_bytes=self.max_text_response_bytes,
-                    url=url,
-                ).decode("utf-8")
+                yield _LimitedReader(response, self.max_text_response_bytes, url)
         except (urllib.error.URLError, ssl.SSLError) as exc:
             raise DownloadError(f"Request failed for {url}: {exc}") from exc
 
@@ -172,3 +229,34 @@ class HttpClient:
                 )
             chunks.append(chunk)
         return b"".join(chunks)
+
+
+class _LimitedReader(io.RawIOBase):
+    def __init__(self, response, max_bytes: int, url: str) -> None:
+        self._response = response
+        self._remaining = max_bytes
+        self._url = url
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            chunks: list[bytes] = []
+            while chunk := self.read(1024 * 1024):
+                chunks.append(chunk)
+            return b"".join(chunks)
+        # Never ask for more than one byte past the limit, so an oversized
+        # body is rejected before it is buffered.
+        chunk = self._response.read(min(size, self._remaining + 1))
+        self._remaining -= len(chunk)
+        if self._remaining < 0:
+            raise DownloadError(
+                f"Response from {self._url} exceeded the allowed size limit."
+            )
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
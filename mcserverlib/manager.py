@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Iterable
 
 from .exceptions import ManifestError
-from .http import HttpClient
+from .http import HttpClient, default_http_client
 from .models import InstallRequest, InstallResult, ServerManifest
 from .process import LogHandler, ServerProcess
 from .providers import create_provider_registry
@@ -20,7 +20,7 @@ from .utils import (
 
 class ServerManager:
     def __init__(self, http_client: HttpClient | None = None) -> None:
-        self.http_client = http_client or HttpClient()
+        self.http_client = http_client or default_http_client()
         self._providers = create_provider_registry()
 
     @property
@@ -7,7 +7,7 @@ from typing import Any, Mapping
 import os
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class StartCommands:
     default: list[str]
     windows: list[str] | None = None
@@ -49,7 +49,7 @@ class InstallRequest:
     server_properties: Mapping[str, str] | None = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ServerManifest:
     loader: str
     minecraft_version: str
@@ -95,7 +95,7 @@ class ServerManifest:
         )
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class InstallResult:
     instance_dir: Path
     manifest_path: Path
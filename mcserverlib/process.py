@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from collections import deque
 from pathlib import Path
+import os
+import select
+import selectors
 import subprocess
 import threading
 from typing import Callable
 
 
 LogHandler = Callable[[str], None]
+ExitHandler = Callable[[int], None]
 
 
 class ServerProcess:
@@ -60,6 +64,55 @@ class ServerProcess:
             if self._log_handler:
                 self._log_handler(line)
 
+    def add_exit_callback(self, callback: ExitHandler) -> None:
+        """Call ``callback(exit_code)`` from a daemon thread once the process exits.
+
+        The watcher blocks on a pidfd (Linux) or a kqueue NOTE_EXIT filter
+        (macOS/BSD) and falls back to a blocking wait elsewhere, so nothing
+        polls while the server is running.
+        """
+        watcher = threading.Thread(
+            target=self._watch_exit,
+            args=(callback,),
+            name="mcserverlib-exit-watcher",
+            daemon=True,
+        )
+        watcher.start()
+
+    def _watch_exit(self, callback: ExitHandler) -> None:
+        self._block_until_exit()
+        callback(self.wait())
+
+    def _block_until_exit(self) -> None:
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is not None:
+            try:
+                pidfd = pidfd_open(self.pid)
+            except OSError:
+                return
+            try:
+                with selectors.DefaultSelector() as selector:
+                    selector.register(pidfd, selectors.EVENT_READ)
+                    selector.select()
+            finally:
+                os.close(pidfd)
+            return
+
+        if hasattr(select, "kqueue"):
+            queue = select.kqueue()
+            try:
+                event = select.kevent(
+                    self.pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                queue.control([event], 1, None)
+            except OSError:
+                return
+            finally:
+                queue.close()
+
     def poll(self) -> int | None:
         return self._process.poll()
 
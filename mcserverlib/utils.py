@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import hashlib
 import json
@@ -10,8 +11,15 @@ from typing import Any, Iterable
 from .exceptions import ManifestError, VersionResolutionError
 from .models import ServerManifest
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 MANIFEST_FILENAME = ".mcserverlib.json"
 DEFAULT_SERVER_PORT = 25565
+_VERSION_SEPARATORS = re.compile(r"[.\-+_]")
+_UNSTABLE_TOKENS = ("snapshot", "alpha", "beta", "rc", "pre")
 
 
 def normalize_loader(loader: str) -> str:
@@ -33,14 +41,15 @@ def normalize_loader(loader: str) -> str:
     return aliases[key]
 
 
+@lru_cache(maxsize=4096)
 def is_stable_version(version: str) -> bool:
     lowered = version.lower()
-    unstable_tokens = ("snapshot", "alpha", "beta", "rc", "pre")
-    return not any(token in lowered for token in unstable_tokens)
+    return not any(token in lowered for token in _UNSTABLE_TOKENS)
 
 
+@lru_cache(maxsize=4096)
 def version_key(version: str) -> tuple[tuple[int, Any], ...]:
-    parts = re.split(r"[.\-+_]", version)
+    parts = _VERSION_SEPARATORS.split(version)
     keyed: list[tuple[int, Any]] = []
     for part in parts:
         if part.isdigit():
@@ -79,6 +88,19 @@ def atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
     Path(temp_name).replace(path)
 
 
+def loads_json(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Serialize ``payload`` as indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+
+
 def load_json(path: Path) -> dict[str, Any]:
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
@@ -1,3 +1,10 @@
+import asyncio
+import contextlib
+import io
+import json
+import threading
+import time
+
 from mcserverlib.catalog import VersionCatalog
 
 
@@ -5,13 +12,25 @@ class _FakeHttp:
     def __init__(self, json_map=None, text_map=None):
         self.json_map = json_map or {}
         self.text_map = text_map or {}
+        self.calls = []
 
     def get_json(self, url):
+        self.calls.append(url)
         return self.json_map[url]
 
     def get_text(self, url):
+        self.calls.append(url)
         return self.text_map[url]
 
+    @contextlib.contextmanager
+    def get_stream(self, url):
+        self.calls.append(url)
+        if url in self.json_map:
+            payload = json.dumps(self.json_map[url])
+        else:
+            payload = self.text_map[url]
+        yield io.BytesIO(payload.encode("utf-8"))
+
 
 def test_vanilla_versions_filter_release():
     url = "https://piston-meta.mojang.com/mc/game/version_manifest_v2.json"
@@ -70,3 +89,90 @@ def test_neoforge_mc_version_mapping():
     assert versions[0] == "1.21.10"
     assert "1.21.1" in versions
     assert "1.21.11" not in versions
+
+
+def test_refresh_all_skips_failed_loaders():
+    url = "https://piston-meta.mojang.com/mc/game/version_manifest_v2.json"
+    http = _FakeHttp(
+        json_map={
+            url: {"versions": [{"id": "1.21.11", "type": "release"}]},
+            "https://api.papermc.io/v2/projects/paper": {"versions": ["1.21.10", "1.21.11"]},
+        }
+    )
+    catalog = VersionCatalog(http_client=http)
+    results = asyncio.run(catalog.refresh_all())
+    assert results["vanilla"] == ["1.21.11"]
+    assert results["paper"] == ["1.21.11", "1.21.10"]
+    assert "forge" not in results
+
+
+def test_catalog_reuses_cached_responses_within_ttl():
+    url = "https://meta.fabricmc.net/v2/versions/game"
+    http = _FakeHttp(json_map={url: [{"version": "1.21.11", "stable": True}]})
+    catalog = VersionCatalog(http_client=http)
+    catalog.list_minecraft_versions("fabric")
+    catalog.list_minecraft_versions("fabric", stable_only=False)
+    assert http.calls == [url]
+
+    catalog.clear_cache()
+    catalog.list_minecraft_versions("fabric")
+    assert http.calls == [url, url]
+
+
+def test_concurrent_cache_misses_share_one_fetch():
+    url = "https://meta.fabricmc.net/v2/versions/game"
+
+    class _SlowHttp(_FakeHttp):
+        def get_json(self, url):
+            time.sleep(0.05)
+            return super().get_json(url)
+
+    http = _SlowHttp(json_map={url: [{"version": "1.21.11", "stable": True}]})
+    catalog = VersionCatalog(http_client=http)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(catalog.list_minecraft_versions("fabric")))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [["1.21.11"], ["1.21.11"]]
+    assert http.calls == [url]
+
+
+def test_forge_metadata_is_fetched_once_across_queries():
+    metadata_url = (
+        "https://maven.minecraftforge.net/net/minecraftforge/forge/maven-metadata.xml"
+    )
+    xml = """\
+<metadata>
+  <versioning>
+    <versions>
+      <version>1.21.11-61.1.1</version>
+      <version>1.21.11-61.1.0</version>
+    </versions>
+  </versioning>
+</metadata>
+"""
+    http = _FakeHttp(text_map={metadata_url: xml})
+    catalog = VersionCatalog(http_client=http)
+    assert catalog.list_minecraft_versions("forge") == ["1.21.11"]
+    assert catalog.list_loader_versions("forge", "1.21.11") == [
+        "1.21.11-61.1.1",
+        "1.21.11-61.1.0",
+    ]
+    assert http.calls == [metadata_url]
+
+
+def test_prefetch_for_warms_loader_version_cache():
+    base = "https://meta.fabricmc.net/v2/versions/loader"
+    entry = [{"loader": {"version": "0.16.0", "stable": True}}]
+    http = _FakeHttp(json_map={f"{base}/1.21.11": entry, f"{base}/1.21.10": entry})
+    catalog = VersionCatalog(http_client=http)
+    asyncio.run(catalog.prefetch_for("fabric", ["1.21.11", "1.21.10", "1.21.9"]))
+    assert sorted(http.calls) == [f"{base}/1.21.10", f"{base}/1.21.11", f"{base}/1.21.9"]
+
+    assert catalog.list_loader_versions("fabric", "1.21.11") == ["0.16.0"]
+    assert len(http.calls) == 3
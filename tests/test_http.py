@@ -1,9 +1,12 @@
 import io
+import urllib.error
 
 import pytest
 
 from mcserverlib.exceptions import DownloadError
-from mcserverlib.http import HttpClient
+from mcserverlib.catalog import VersionCatalog
+from mcserverlib.http import MAX_VALIDATOR_ENTRIES, HttpClient, default_http_client
+from mcserverlib.manager import ServerManager
 
 
 class _FakeResponse:
@@ -36,10 +39,75 @@ def test_http_client_blocks_private_ip_hosts():
 def test_http_client_limits_text_response_size(monkeypatch):
     client = HttpClient(max_text_response_bytes=5)
 
-    def _fake_open(request, timeout=0):
+    def _fake_open(request, timeout=0, context=None):
         return _FakeResponse(b"too-large-response")
 
     monkeypatch.setattr("urllib.request.urlopen", _fake_open)
     with pytest.raises(DownloadError):
         client.get_text("https://example.com/test.txt")
 
+
+def test_http_client_revalidates_with_etag(monkeypatch):
+    client = HttpClient()
+    seen_headers = []
+
+    def _fake_open(request, timeout=0, context=None):
+        seen_headers.append(request.get_header("If-none-match"))
+        if len(seen_headers) == 1:
+            return _FakeResponse(b'{"versions": []}', headers={"ETag": '"abc"'})
+        raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+
+    monkeypatch.setattr("urllib.request.urlopen", _fake_open)
+    assert client.get_json("https://example.com/meta.json") == {"versions": []}
+    assert client.get_json("https://example.com/meta.json") == {"versions": []}
+    assert seen_headers == [None, '"abc"']
+
+
+def test_http_client_bounds_revalidation_cache(monkeypatch):
+    client = HttpClient()
+
+    def _fake_open(request, timeout=0, context=None):
+        return _FakeResponse(b"{}", headers={"ETag": '"abc"'})
+
+    monkeypatch.setattr("urllib.request.urlopen", _fake_open)
+    for index in range(MAX_VALIDATOR_ENTRIES + 5):
+        client.get_json(f"https://example.com/{index}.json")
+    assert len(client._validators) == MAX_VALIDATOR_ENTRIES
+    assert "https://example.com/0.json" not in client._validators
+
+
+def test_http_client_stream_enforces_size_limit(monkeypatch):
+    client = HttpClient(max_text_response_bytes=5)
+
+    def _fake_open(request, timeout=0, context=None):
+        return _FakeResponse(b"too-large-response")
+
+    monkeypatch.setattr("urllib.request.urlopen", _fake_open)
+    with pytest.raises(DownloadError):
+        with client.get_stream("https://example.com/meta.xml") as stream:
+            stream.read()
+
+
+def test_http_client_stream_reads_stop_at_the_limit(monkeypatch):
+    client = HttpClient(max_text_response_bytes=5)
+    requested = []
+
+    class _RecordingResponse(_FakeResponse):
+        def read(self, size: int = -1) -> bytes:
+            requested.append(size)
+            return super().read(size)
+
+    def _fake_open(request, timeout=0, context=None):
+        return _RecordingResponse(b"x" * 4096)
+
+    monkeypatch.setattr("urllib.request.urlopen", _fake_open)
+    with pytest.raises(DownloadError):
+        with client.get_stream("https://example.com/meta.xml") as stream:
+            stream.read()
+    assert requested and all(0 <= size <= 6 for size in requested)
+
+
+def test_catalog_and_manager_share_default_client():
+    client = default_http_client()
+    assert ServerManager().http_client is client
+    assert VersionCatalog().http_client is client
@@ -0,0 +1,24 @@
+from pathlib import Path
+import sys
+import threading
+
+from mcserverlib.process import ServerProcess
+
+
+def test_exit_callback_receives_exit_code(tmp_path: Path):
+    process = ServerProcess.start(
+        [sys.executable, "-c", "import sys; print('ready'); sys.exit(3)"],
+        cwd=tmp_path,
+    )
+    exited = threading.Event()
+    codes: list[int] = []
+
+    def _on_exit(code: int) -> None:
+        codes.append(code)
+        exited.set()
+
+    process.add_exit_callback(_on_exit)
+
+    assert exited.wait(timeout=10)
+    assert codes == [3]
+    assert not process.is_running()
@@ -1,5 +1,11 @@
 from mcserverlib.models import ServerManifest, StartCommands
-from mcserverlib.utils import parse_properties_file, pick_latest_version, read_server_endpoint
+from mcserverlib.utils import (
+    dumps_json,
+    loads_json,
+    parse_properties_file,
+    pick_latest_version,
+    read_server_endpoint,
+)
 
 
 def test_pick_latest_version_prefers_stable_values():
@@ -51,3 +57,10 @@ def test_read_server_endpoint_defaults_when_missing_or_invalid_port(tmp_path):
     props_path = tmp_path / "server.properties"
     props_path.write_text("server-ip=mc.example.com\nserver-port=abc\n", encoding="utf-8")
     assert read_server_endpoint(tmp_path) == ("mc.example.com", 25565)
+
+
+def test_dumps_json_round_trips_with_trailing_newline():
+    payload = {"loader": "paper", "notes": ["a", "b"], "build": None}
+    encoded = dumps_json(payload)
+    assert encoded.endswith(b"\n")
+    assert loads_json(encoded) == payload